@@ -29,6 +29,8 @@ Two layers are provided:
 
 from __future__ import annotations
 
+import sys
+
 BOT_SUFFIX = "[bot]"
 
 # GraphQL ``__typename`` value for an App/bot actor.
@@ -86,12 +88,16 @@ def canonical_bot_login(login: str | None, typename: str | None = None) -> str:
 
     Returns:
         The canonical login, or ``"unknown"`` when ``login`` is empty.
+        The result is interned: an owner-wide scan yields thousands of
+        PRs from a handful of bots, and sharing one string per login
+        keeps them from each holding a copy (and lets equality checks
+        between them succeed on identity).
     """
     if not login:
         return "unknown"
     if typename == _BOT_TYPENAME and not login.endswith(BOT_SUFFIX):
-        return f"{login}{BOT_SUFFIX}"
-    return login
+        return sys.intern(f"{login}{BOT_SUFFIX}")
+    return sys.intern(login)
 
 
 def normalize_bot_login(login: str | None) -> str:
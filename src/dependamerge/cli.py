@@ -90,6 +90,12 @@ MAX_RETRIES = 2
 # (fire-and-forget).
 DEFAULT_MAX_WAIT = 900.0
 
+# Repository scan workers for the owner-wide similar-PR search.  Each
+# scan is dominated by network latency rather than CPU, so a wider pool
+# than GitHubService's default cuts wall-clock time roughly linearly;
+# GitHubAsync's own request semaphore still caps in-flight HTTP calls.
+SIMILAR_PR_SCAN_WORKERS = 16
+
 
 def version_callback(value: bool):
     """Callback to show version and exit."""
@@ -346,6 +352,9 @@ class _MergeContext:
     # Applies to owner/user-wide runs; ignored for single-PR and
     # single-repository merges.
     max_wait: float = DEFAULT_MAX_WAIT
+    # Cap on similar PRs collected by the owner-wide scan; once reached,
+    # no further repositories are scanned.  0 = unlimited.
+    max_matches: int = 0
 
     # Derived / mutable state
     github_client: GitHubClient | None = None
@@ -717,6 +726,7 @@ def _scan_and_find_similar(ctx: _MergeContext) -> None:
         svc = GitHubService(
             token=ctx.token,
             progress_tracker=ctx.progress_tracker,
+            max_repo_tasks=SIMILAR_PR_SCAN_WORKERS,
             debug_matching=ctx.debug_matching,
         )
         try:
@@ -731,6 +741,7 @@ def _scan_and_find_similar(ctx: _MergeContext) -> None:
                 ctx.source_pr,
                 ctx.comparator,
                 only_automation=only_automation,
+                max_matches=ctx.max_matches or None,
             )
         finally:
             await svc.close()
@@ -2116,6 +2127,16 @@ def merge(
             f"never block). Default: {DEFAULT_MAX_WAIT:.0f}"
         ),
     ),
+    max_matches: int = typer.Option(
+        0,
+        "--max-matches",
+        min=0,
+        help=(
+            "Single PR URL only: stop scanning the owner's repositories "
+            "once this many similar PRs have been found. "
+            "0 = unlimited. Default: 0"
+        ),
+    ),
     show_progress: bool = typer.Option(
         True, "--progress/--no-progress", help="Show real-time progress updates"
     ),
@@ -2351,6 +2372,20 @@ def merge(
                     console.print(f"❌ Invalid URL: {repo_err}")
                 raise typer.Exit(1) from None
 
+    # --max-matches caps the similar-PR scan behind a single GitHub PR
+    # URL; owner-wide, repository and Gerrit runs have no such scan, so
+    # refuse the option there rather than ignore it.
+    if (
+        isinstance(max_matches, int)
+        and max_matches > 0
+        and (parsed_url is None or parsed_url.is_gerrit)
+    ):
+        console.print(
+            "❌ Invalid --max-matches: only supported with a single GitHub "
+            "pull request URL"
+        )
+        raise typer.Exit(1)
+
     if parsed_url is not None and parsed_url.is_gerrit:
         _handle_gerrit_merge(
             parsed_url=parsed_url,
@@ -2505,6 +2540,7 @@ def merge(
     ctx = _MergeContext(
         pr_url=parsed_url.original_url,
         max_wait=max_wait,
+        max_matches=max_matches,
         no_confirm=no_confirm,
         similarity_threshold=similarity_threshold,
         merge_method=merge_method,
@@ -2679,21 +2715,27 @@ def _display_pr_info(
     progress_tracker: ProgressTracker | None = None,
 ) -> None:
     """Display pull request information in a formatted table."""
+    # Resolve every value before building the table.  The status lookup
+    # may hit the REST API (blocked PRs are analysed for the reason), so
+    # do it up front rather than between row insertions; the table is
+    # then assembled in one pass from plain strings.
+    rows = (
+        ("Repository", pr.repository_full_name),
+        ("PR Number", str(pr.number)),
+        ("Title", pr.title),
+        ("Author", pr.author),
+        ("State", pr.state),
+        # Get proper status instead of raw mergeable field
+        ("Status", github_client.get_pr_status_details(pr)),
+        ("Files Changed", str(len(pr.files_changed))),
+        ("URL", pr.html_url),
+    )
+
     table = Table(title=title)
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="green")
-
-    # Get proper status instead of raw mergeable field
-    status = github_client.get_pr_status_details(pr)
-
-    table.add_row("Repository", pr.repository_full_name)
-    table.add_row("PR Number", str(pr.number))
-    table.add_row("Title", pr.title)
-    table.add_row("Author", pr.author)
-    table.add_row("State", pr.state)
-    table.add_row("Status", status)
-    table.add_row("Files Changed", str(len(pr.files_changed)))
-    table.add_row("URL", pr.html_url)
+    for prop, value in rows:
+        table.add_row(prop, value)
 
     if progress_tracker:
         progress_tracker.suspend()
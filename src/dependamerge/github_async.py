@@ -187,6 +187,16 @@ class GitHubAsync:
     # concurrency back up after a period of throttling.
     _DEFAULT_MAX_CONCURRENCY = 20
 
+    # Most responses kept in a conditional-request (ETag) cache; the
+    # least recently used entry is dropped beyond this.
+    _ETAG_CACHE_MAX_ENTRIES = 128
+
+    # How long (seconds) an idle pooled connection is kept for reuse.
+    # httpx's 5s default drops the connection between the polling rounds
+    # of the merge pipeline (and across rate-limit waits), so each round
+    # paid a fresh TCP + TLS handshake.
+    _KEEPALIVE_EXPIRY = 60.0
+
     # Heuristic used by ``_get_recent_error_rate`` to estimate how many
     # requests accompanied each observed error within the error window.
     # We do not track total request counts, only errors, so we assume each
@@ -215,6 +225,7 @@ class GitHubAsync:
         on_rate_limited: Callable[[float], None | Awaitable[None]] | None = None,
         on_rate_limit_cleared: Callable[[], None | Awaitable[None]] | None = None,
         on_metrics: Callable[[int, float], None | Awaitable[None]] | None = None,
+        etag_cache: dict[str, tuple[str, bytes, str]] | None = None,
     ):
         """
         Initialize the async client.
@@ -232,6 +243,13 @@ class GitHubAsync:
             logger: Optional logger for client messages.
             on_rate_limited: Callback invoked with reset_epoch when primary limit hit.
             on_rate_limit_cleared: Callback invoked when resuming after rate limit.
+            etag_cache: Optional mapping used for conditional REST GETs. When
+                given, GET responses carrying an ``ETag`` are stored in it and
+                later requests for the same URL send ``If-None-Match``; a
+                ``304 Not Modified`` reply is answered from the stored body,
+                decoded afresh so callers may modify the result.  At most
+                ``_ETAG_CACHE_MAX_ENTRIES`` responses are kept.  Pass the
+                same mapping to several clients to share it.
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
@@ -290,6 +308,13 @@ class GitHubAsync:
         self._token_scopes: set[str] | None = None
         self._token_scopes_fetched: bool = False
 
+        # Conditional-request store: full request URL -> (ETag, raw JSON
+        # body, Link header).  GitHub does not count ``304 Not Modified``
+        # replies against the primary rate limit, so revalidating an
+        # unchanged PR, file list or review list is close to free.  The
+        # Link header is kept so pagination still works from a 304.
+        self._etag_cache = etag_cache
+
         mounts = None
         if proxies:
             mounts = {}
@@ -307,6 +332,15 @@ class GitHubAsync:
             timeout=timeout,
             verify=verify,
             mounts=mounts,
+            # Keep as many idle connections as there are request slots so
+            # that, when HTTP/2 is not negotiated (some proxies), a burst
+            # of concurrent requests does not close and reopen
+            # HTTP/1.1 connections.  100 / 20 are httpx's own defaults.
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=max(max_concurrency, 20),
+                keepalive_expiry=self._KEEPALIVE_EXPIRY,
+            ),
         )
 
     def __repr__(self) -> str:
@@ -613,8 +647,12 @@ class GitHubAsync:
             self.log.debug("Retryable HTTP status %s received", r.status_code)
             raise RetryableError(f"Transient HTTP status: {r.status_code}")
 
-        # All other errors -> raise
-        r.raise_for_status()
+        # All other errors -> raise.  A 304 is only ever returned for a
+        # conditional GET we issued from the ETag cache; the caller serves
+        # the cached body, and its rate-limit headers still feed the
+        # tuning below.
+        if r.status_code != 304:
+            r.raise_for_status()
 
         # Apply adaptive delay based on recent error patterns
         if self._adaptive_delay > 0:
@@ -681,8 +719,43 @@ class GitHubAsync:
     async def get(
         self, path: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any] | list[dict[str, Any]]:
-        r = await self._request("GET", f"{self.api_url}{path}", params=params)
-        return r.json()  # type: ignore[no-any-return]
+        data, _ = await self._get_json(f"{self.api_url}{path}", params)
+        return data  # type: ignore[no-any-return]
+
+    async def _get_json(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> tuple[Any, str]:
+        """GET ``url`` and return ``(parsed JSON, Link header)``.
+
+        Uses a conditional request when an ETag cache was supplied and a
+        previous response for the same URL is stored in it.
+        """
+        if self._etag_cache is None:
+            r = await self._request("GET", url, params=params)
+            return r.json(), r.headers.get("Link", "")
+
+        key = str(httpx.URL(url, params=params))
+        cached = self._etag_cache.get(key)
+        if cached is not None:
+            r = await self._request(
+                "GET", url, params=params, headers={"If-None-Match": cached[0]}
+            )
+            if r.status_code == 304:
+                # Refresh the entry's recency for the size bound below.
+                self._etag_cache[key] = self._etag_cache.pop(key, cached)
+                return json.loads(cached[1]), cached[2]
+        else:
+            r = await self._request("GET", url, params=params)
+
+        data = r.json()
+        link = r.headers.get("Link", "")
+        etag = r.headers.get("ETag")
+        if etag:
+            self._etag_cache.pop(key, None)
+            self._etag_cache[key] = (etag, r.content, link)
+            while len(self._etag_cache) > self._ETAG_CACHE_MAX_ENTRIES:
+                del self._etag_cache[next(iter(self._etag_cache))]
+        return data, link
 
     async def post(
         self, path: str, json: dict[str, Any] | None = None
@@ -2583,8 +2656,7 @@ class GitHubAsync:
         while True:
             q = dict(params or {})
             q.update({"per_page": per_page, "page": page})
-            r = await self._request("GET", f"{self.api_url}{path}", params=q)
-            data = r.json()
+            data, link = await self._get_json(f"{self.api_url}{path}", q)
             if not data:
                 return
             yield data
@@ -2592,7 +2664,6 @@ class GitHubAsync:
             if max_pages and page > max_pages:
                 return
             # Stop when Link header doesn't include 'rel="next"'
-            link = r.headers.get("Link", "")
             if 'rel="next"' not in link:
                 return
 
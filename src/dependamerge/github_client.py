@@ -3,6 +3,7 @@
 
 import asyncio
 import os
+import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
@@ -19,6 +20,18 @@ from .url_parser import _host_matches
 if TYPE_CHECKING:
     from .progress_tracker import ProgressTracker
 
+# ``/<owner>/<repo>/pull/<number>`` with optional trailing segments.  Only
+# the path is matched; the host is validated separately via urlparse.
+_PR_PATH_RE = re.compile(r"/([^/]+)/([^/]+)/pull/(\d+)(?:/|$)")
+
+# Status shown for a PR GitHub reports as not mergeable, keyed by its
+# ``mergeable_state``; other states fall back to "Not mergeable (...)".
+_UNMERGEABLE_STATE_MESSAGES = {
+    "dirty": "Merge conflicts",
+    "behind": "Rebase required",
+    "blocked": "Blocked by checks",
+}
+
 
 class GitHubClient:
     """GitHub API client for managing pull requests."""
@@ -31,6 +44,17 @@ class GitHubClient:
                 "GitHub token is required. Set GITHUB_TOKEN environment variable."
             )
         self.token: str = resolved
+        # Shared by the short-lived GitHubAsync clients created per call so
+        # PR, file and review lookups revalidate with If-None-Match and an
+        # unchanged resource comes back as a cheap 304.
+        #
+        # The cache is process-local on purpose.  A run fetches only the
+        # source PR over REST (the owner-wide scan is GraphQL), and
+        # mergeability, reviews and checks change without the head SHA
+        # moving, so a store persisted across runs and keyed by head SHA
+        # could only reuse the file list -- one or two requests -- at the
+        # cost of on-disk state.
+        self._etag_cache: dict[str, tuple[str, bytes, str]] = {}
 
     def __repr__(self) -> str:
         """Safe repr that never exposes the token value."""
@@ -45,27 +69,14 @@ class GitHubClient:
         if not _host_matches(host, "github.com"):
             raise ValueError(f"Invalid GitHub PR URL: {url}")
 
-        # Use parsed.path to ignore query strings and fragments
-        # when splitting.
-        parts = parsed.path.strip("/").split("/")
-        if "pull" not in parts:
+        # Match parsed.path so query strings and fragments are ignored;
+        # trailing segments such as /files or /commits are allowed.
+        match = _PR_PATH_RE.match(parsed.path)
+        if match is None:
             raise ValueError(f"Invalid GitHub PR URL: {url}")
 
-        # Find the 'pull' segment and get the PR number
-        try:
-            pull_index = parts.index("pull")
-            if pull_index + 1 >= len(parts):
-                raise ValueError(
-                    "PR number not found after 'pull'"
-                )
-
-            owner = parts[pull_index - 2]
-            repo = parts[pull_index - 1]
-            pr_number = int(parts[pull_index + 1])
-
-            return owner, repo, pr_number
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid GitHub PR URL: {url}") from e
+        owner, repo, pr_number = match.groups()
+        return owner, repo, int(pr_number)
 
     def get_pull_request_info(
         self, owner: str, repo: str, pr_number: int
@@ -74,7 +85,9 @@ class GitHubClient:
         from .github_async import GitHubAsync
 
         async def _run() -> PullRequestInfo:
-            async with GitHubAsync(token=self.token) as api:
+            async with GitHubAsync(
+                token=self.token, etag_cache=self._etag_cache
+            ) as api:
                 pr_response = await api.get(f"/repos/{owner}/{repo}/pulls/{pr_number}")
                 assert isinstance(pr_response, dict), (
                     "PR endpoint should return a dictionary"
@@ -185,7 +198,9 @@ class GitHubClient:
 
         async def _run() -> list[str]:
             messages: list[str] = []
-            async with GitHubAsync(token=self.token) as api:
+            async with GitHubAsync(
+                token=self.token, etag_cache=self._etag_cache
+            ) as api:
                 async for page in api.get_paginated(
                     f"/repos/{owner}/{repo}/pulls/{pr_number}/commits", per_page=100
                 ):
@@ -266,7 +281,8 @@ class GitHubClient:
             print(f"Failed to merge PR {pr_number}: {e}")
             return False
 
-    def is_automation_author(self, author: str) -> bool:
+    @staticmethod
+    def is_automation_author(author: str) -> bool:
         """Check if the author is a known automation tool.
 
         Delegates to the shared :func:`bot_identity.is_automation_author`
@@ -279,45 +295,33 @@ class GitHubClient:
         if pr_info.state != "open":
             return f"Closed ({pr_info.state})"
 
+        state = pr_info.mergeable_state
+
         # Check for draft status first
-        if pr_info.mergeable_state == "draft":
+        if state == "draft":
             return "Draft PR"
 
-        # Handle blocked state - need to determine why it's blocked
-        if pr_info.mergeable_state == "blocked" and pr_info.mergeable is True:
-            # This means technically mergeable but blocked by branch protection
-            # We need to check what's blocking it to provide intelligent status
-            block_reason = self._analyze_block_reason(pr_info)
-            return block_reason
-
-        if pr_info.mergeable is False:
-            # Check for specific reasons why it's not mergeable
-            if pr_info.mergeable_state == "dirty":
-                return "Merge conflicts"
-            elif pr_info.mergeable_state == "behind":
+        if pr_info.mergeable is True:
+            if state == "blocked":
+                # Technically mergeable but blocked by branch protection;
+                # determine what is blocking it for an intelligent status.
+                return self._analyze_block_reason(pr_info)
+            if state == "behind":
                 return "Rebase required"
-            elif pr_info.mergeable_state == "blocked":
-                return "Blocked by checks"
-            else:
-                return f"Not mergeable ({pr_info.mergeable_state or 'unknown'})"
-
-        if pr_info.mergeable_state == "behind":
-            return "Rebase required"
-
-        # If mergeable is True and mergeable_state is clean, it's ready
-        if pr_info.mergeable is True and pr_info.mergeable_state == "clean":
+            # clean, unstable (CI still running) or any other state.
             return "Ready to merge"
 
-        # Handle unstable state - this usually means CI is running but PR is mergeable
-        if pr_info.mergeable is True and pr_info.mergeable_state == "unstable":
-            return "Ready to merge"
+        if pr_info.mergeable is False:
+            message = _UNMERGEABLE_STATE_MESSAGES.get(state or "")
+            if message is not None:
+                return message
+            return f"Not mergeable ({state or 'unknown'})"
 
-        # For any other combination where mergeable is True but state is unclear
-        if pr_info.mergeable is True:
-            return "Ready to merge"
+        if state == "behind":
+            return "Rebase required"
 
         # Fallback for unclear states
-        return f"Status unclear ({pr_info.mergeable_state or 'unknown'})"
+        return f"Status unclear ({state or 'unknown'})"
 
     def _analyze_block_reason(self, pr_info: PullRequestInfo) -> str:
         """Analyze why a PR is blocked and return appropriate status using REST."""
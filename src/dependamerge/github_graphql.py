@@ -33,10 +33,27 @@ __all__ = [
 # ``isFork`` is included so owner-wide bulk operations can exclude fork
 # repositories without a second round-trip; existing consumers that only
 # read ``nameWithOwner`` / ``isArchived`` simply ignore the extra field.
+#
+# The open pull request ``totalCount`` lets PR-scanning paths skip the
+# per-repository REPO_OPEN_PRS_PAGE query for repositories that have no
+# open PRs at all, which is the common case in large organizations.
+#
+# Archived repositories are filtered server-side with ``isArchived: false``:
+# every consumer skips them anyway, so there is no point paging through
+# them, and the connection ``totalCount`` no longer counts repositories
+# that are never visited.
+#
+# Repositories come most recently pushed first, so a scan that stops
+# early (``--max-matches``) has covered the most active repositories.
 ORG_REPOS_ONLY = """
 query($org: String!, $reposCursor: String) {
   organization(login: $org) {
-    repositories(first: 100, after: $reposCursor, orderBy: { field: NAME, direction: ASC }) {
+    repositories(
+      first: 100
+      after: $reposCursor
+      isArchived: false
+      orderBy: { field: PUSHED_AT, direction: DESC }
+    ) {
       totalCount
       pageInfo {
         hasNextPage
@@ -46,6 +63,9 @@ query($org: String!, $reposCursor: String) {
         nameWithOwner
         isArchived
         isFork
+        pullRequests(states: OPEN) {
+          totalCount
+        }
       }
     }
   }
@@ -62,7 +82,12 @@ query($org: String!, $reposCursor: String) {
 USER_REPOS_ONLY = """
 query($org: String!, $reposCursor: String) {
   user(login: $org) {
-    repositories(first: 100, after: $reposCursor, orderBy: { field: NAME, direction: ASC }) {
+    repositories(
+      first: 100
+      after: $reposCursor
+      isArchived: false
+      orderBy: { field: PUSHED_AT, direction: DESC }
+    ) {
       totalCount
       pageInfo {
         hasNextPage
@@ -72,6 +97,9 @@ query($org: String!, $reposCursor: String) {
         nameWithOwner
         isArchived
         isFork
+        pullRequests(states: OPEN) {
+          totalCount
+        }
       }
     }
   }
@@ -6,9 +6,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from .bot_identity import canonical_bot_login, is_automation_author
 from .github_async import (
@@ -36,6 +37,8 @@ from .models import (
     UnmergeableReason,
 )
 
+_T = TypeVar("_T")
+
 # GitHub API tuning defaults - optimized for performance and rate limit compliance
 DEFAULT_PRS_PAGE_SIZE = 30  # Pull requests per GraphQL page
 DEFAULT_FILES_PAGE_SIZE = 50  # Files per pull request
@@ -52,6 +55,18 @@ AUTOMATION_TOOLS = [
     "[bot]",
 ]
 
+# Login substrings that qualify a candidate PR as automation in the
+# similar-PR scan.  This is a substring match (any login containing
+# "bot" counts), so it is intentionally broader than the exact-name
+# matching in bot_identity.  Built once here rather than per candidate.
+_CANDIDATE_AUTOMATION_MARKERS = (
+    "dependabot",
+    "renovate",
+    "pre-commit",
+    "github-actions",
+    "bot",
+)
+
 
 def _str_or_none(value: Any) -> str | None:
     """Return ``value`` as a string when truthy, else None.
@@ -229,6 +244,11 @@ class GitHubService:
                 if self._progress:
                     self._progress.start_repository(repo_full_name)
                 try:
+                    if not self._repo_has_open_prs(repo_node):
+                        if self._progress:
+                            self._progress.complete_repository(0)
+                        return [], 0, 1, repo_errors
+
                     owner, name = self._split_owner_repo(repo_full_name)
                     first_nodes, page_info = await self._fetch_repo_prs_first_page(
                         owner, name
@@ -327,10 +347,9 @@ class GitHubService:
         complete picture of every repository the owner has, whereas the
         bulk-merge path deliberately excludes forks.  The progress total
         is published from the first page's ``totalCount``, which counts
-        *all* of the owner's repositories — including the archived repos
-        this iterator filters out — so the denominator is approximate and
-        the percentage can finish below 100%.  It is close enough for a
-        progress bar.
+        every non-archived repository.  Archived repositories are already
+        excluded server-side and forks are kept, so the total matches the
+        repositories this iterator yields.
         """
         async for repo in self._iter_owner_repositories(org, skip_forks=False):
             yield repo
@@ -434,16 +453,17 @@ class GitHubService:
         correct GraphQL root is resolved once via
         :meth:`_resolve_owner_root` and reused for every page.
 
-        Archived repositories are always skipped.  Fork repositories are
-        skipped by default (``skip_forks=True``): owner-wide bulk merges
-        target the owner's own automation PRs, not PRs on mirrored
-        forks.  Read-only reporting paths pass ``skip_forks=False`` to
-        include forks for a complete picture.  The progress total is
-        published from the first page's ``totalCount``, which counts
-        *all* of the owner's repositories — including the archived and
-        (when filtered) fork repos this iterator skips — so the
-        denominator is approximate and the percentage can finish below
-        100%.  It is close enough for a progress bar.
+        Archived repositories are always skipped; the listing queries
+        already exclude them server-side and the client-side check is
+        kept as a guard.  Fork repositories are skipped by default
+        (``skip_forks=True``): owner-wide bulk merges target the owner's
+        own automation PRs, not PRs on mirrored forks.  Read-only
+        reporting paths pass ``skip_forks=False`` to include forks for a
+        complete picture.  The progress total is published from the
+        first page's ``totalCount``, which counts every non-archived
+        repository — including the fork repos this iterator skips when
+        filtering — so the denominator is approximate and the percentage
+        can finish below 100%.  It is close enough for a progress bar.
         """
         root_key, query = await self._resolve_owner_root(owner)
         cursor: str | None = None
@@ -473,6 +493,97 @@ class GitHubService:
                 break
             cursor = page_info.get("endCursor")
 
+    @staticmethod
+    def _repo_has_open_prs(repo_node: dict[str, Any]) -> bool:
+        """Return False only when a repository node reports zero open PRs.
+
+        The repository listing queries carry ``pullRequests(states: OPEN)
+        { totalCount }`` so callers can skip the per-repository PR query
+        for repositories with nothing to scan.  A node without the field
+        (older query shapes, test doubles) is assumed to have open PRs so
+        it is still scanned.
+        """
+        open_prs = repo_node.get("pullRequests")
+        if not isinstance(open_prs, dict):
+            return True
+        total = open_prs.get("totalCount")
+        return not (isinstance(total, int) and total == 0)
+
+    async def _run_repo_pipeline(
+        self,
+        repos: AsyncIterator[dict[str, Any]],
+        handle: Callable[[dict[str, Any]], Awaitable[_T]],
+        stop: asyncio.Event | None = None,
+    ) -> list[_T]:
+        """Run ``handle`` over streamed repository nodes with bounded concurrency.
+
+        Bounded producer/consumer pipeline.  A fixed pool of workers
+        (sized to the repo-concurrency limit) drains repository nodes
+        from a queue fed by the paginated iterator, so per-repository
+        work starts as soon as the first page of repositories arrives
+        instead of after the whole owner has been enumerated.  This also
+        caps in-flight work — both pending tasks and buffered nodes —
+        instead of materialising one task per repository up front, which
+        matters for owners with thousands of repositories.
+
+        Results are returned in enumeration order.  An exception from any
+        worker (e.g. a propagated rate-limit error) tears the whole
+        pipeline down and is re-raised, preserving the global-throttle
+        semantics of aborting the run rather than skipping repos.
+
+        When ``stop`` is set (e.g. by ``handle`` once it has found enough
+        matches), no further repositories are enumerated or handled;
+        handlers already in flight finish and their results are kept.
+        """
+        worker_count = max(1, self._max_repo_tasks)
+        queue: asyncio.Queue[tuple[int, dict[str, Any]] | None] = asyncio.Queue(
+            maxsize=worker_count * 2
+        )
+        results: dict[int, _T] = {}
+
+        async def producer() -> None:
+            index = 0
+            async for repo in repos:
+                if stop is not None and stop.is_set():
+                    break
+                await queue.put((index, repo))
+                index += 1
+            # One sentinel per worker so each terminates once the backlog
+            # drains.
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, repo = item
+                if stop is not None and stop.is_set():
+                    # Keep draining so the producer never blocks on a
+                    # full queue before it notices the stop.
+                    continue
+                # Safe to mutate the shared dict without a lock: asyncio
+                # is single-threaded and the assignment does not await.
+                results[index] = await handle(repo)
+
+        producer_task = asyncio.create_task(producer())
+        worker_tasks = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        pipeline = [producer_task, *worker_tasks]
+        try:
+            # No return_exceptions: a propagated error aborts the
+            # pipeline (the desired behaviour for global throttling).
+            await asyncio.gather(*pipeline)
+        except BaseException:
+            # Tear the pipeline down so no worker is left blocked on the
+            # queue, then re-raise the original (e.g. rate-limit) error.
+            for task in pipeline:
+                task.cancel()
+            await asyncio.gather(*pipeline, return_exceptions=True)
+            raise
+
+        return [results[index] for index in sorted(results)]
+
     async def _iter_repo_open_prs_pages(
         self, owner: str, name: str, cursor: str | None
     ) -> AsyncIterator[dict[str, Any]]:
@@ -666,8 +777,10 @@ class GitHubService:
         mergeable_raw = pr.get("mergeable")
         merge_state_raw = pr.get("mergeStateStatus")
         self.log.debug(
-            f"GraphQL raw values for PR {pr.get('number', 'unknown')}: "
-            f"mergeable='{mergeable_raw}', mergeStateStatus='{merge_state_raw}'"
+            "GraphQL raw values for PR %s: mergeable='%s', mergeStateStatus='%s'",
+            pr.get("number", "unknown"),
+            mergeable_raw,
+            merge_state_raw,
         )
 
         return PullRequestInfo(
@@ -680,7 +793,8 @@ class GitHubService:
                 (pr.get("author") or {}).get("__typename"),
             ),
             head_sha=pr.get("headRefOid") or "",
-            base_branch=pr.get("baseRefName") or "",
+            # Few distinct values across a scan; share one string each.
+            base_branch=sys.intern(pr.get("baseRefName") or ""),
             head_branch=pr.get("headRefName") or "",
             state="open",  # GraphQL query filters for OPEN PRs only, so all results are open
             mergeable=self._map_mergeable_enum(pr.get("mergeable")),
@@ -721,10 +835,17 @@ class GitHubService:
         comparator,
         *,
         only_automation: bool,
+        max_matches: int | None = None,
     ) -> list[tuple[PullRequestInfo, ComparisonResult]]:
         """
         Find PRs across an organization that are similar to the provided source PR.
 
+        Repositories are streamed from the owner listing into a worker
+        pool bounded by ``max_repo_tasks``; results keep repository order.
+        With ``max_matches`` set, the scan stops enumerating repositories
+        once that many similar PRs have been found, and at most that many
+        are returned.
+
         This integrates progress updates:
         - Updates total repositories
         - Starts/completes repository sections
@@ -736,166 +857,240 @@ class GitHubService:
             source_pr: The PR to compare against.
             comparator: Provides compare_pull_requests(source, target) -> ComparisonResult.
             only_automation: If True, restrict candidates to automation PRs; otherwise, same author as source.
+            max_matches: Optional cap on the number of similar PRs; ``None`` scans every repository.
 
         Returns:
             List of (PullRequestInfo, ComparisonResult) tuples for similar PRs.
         """
-        results: list[tuple[PullRequestInfo, ComparisonResult]] = []
+        enough = asyncio.Event()
+        found = 0
+
+        async def process_repo(
+            repo: dict[str, Any],
+        ) -> list[tuple[PullRequestInfo, ComparisonResult]]:
+            nonlocal found
+            async with self._repo_semaphore:
+                if enough.is_set():
+                    return []
+                matches = await self._find_similar_prs_in_repo(
+                    repo, source_pr, comparator, only_automation=only_automation
+                )
+            counted = len(matches)
+            if max_matches is not None:
+                # Matches past the cap are cut from the result below, so
+                # they are not reported as found either.
+                counted = min(counted, max_matches - found)
+            found += counted
+            if counted and self._progress:
+                # We can reuse 'found_similar_pr' if using MergeProgressTracker,
+                # otherwise this call will be a no-op for ProgressTracker.
+                try:
+                    self._progress.found_similar_pr(counted)  # type: ignore[attr-defined]
+                except Exception:
+                    # No-op when the tracker lacks this method or the
+                    # display update fails; counting is cosmetic only.
+                    pass
+            if max_matches is not None and found >= max_matches:
+                enough.set()
+            return matches
 
+        # Stream repositories into a bounded worker pool so comparisons
+        # start as soon as the first page of repositories arrives and
+        # the GraphQL round-trips of different repositories overlap.
         # Repo total is set automatically by _iter_org_repositories
         # on the first GraphQL page via totalCount.
-        async for repo in self._iter_org_repositories_with_open_prs(org):
-            repo_full_name = repo.get("nameWithOwner") or ""
-            if not repo_full_name or "/" not in repo_full_name:
-                if self._progress:
-                    self._progress.add_error()
-                continue
+        results: list[tuple[PullRequestInfo, ComparisonResult]] = []
+        for matches in await self._run_repo_pipeline(
+            self._iter_org_repositories_with_open_prs(org), process_repo, enough
+        ):
+            results.extend(matches)
+        if max_matches is not None:
+            # Repositories that were already in flight when the cap was
+            # reached may overshoot it; keep the earliest in scan order.
+            del results[max_matches:]
+        return results
+
+    async def _find_similar_prs_in_repo(
+        self,
+        repo: dict[str, Any],
+        source_pr: PullRequestInfo,
+        comparator,
+        *,
+        only_automation: bool,
+    ) -> list[tuple[PullRequestInfo, ComparisonResult]]:
+        """Compare every open PR of one repository against ``source_pr``.
 
+        This is the per-repository body of :meth:`find_similar_prs`; it
+        owns the ``start_repository`` / ``complete_repository`` progress
+        lifecycle for the repository it scans.
+        """
+        repo_full_name = repo.get("nameWithOwner") or ""
+        if not repo_full_name or "/" not in repo_full_name:
             if self._progress:
-                self._progress.start_repository(repo_full_name)
-                self._progress.update_operation(
-                    f"Getting open PRs from {repo_full_name}"
-                )
+                self._progress.add_error()
+            return []
 
-            owner_n, name_n = repo_full_name.split("/", 1)
-            first_nodes, page_info = await self._fetch_repo_prs_first_page(
-                owner_n, name_n
-            )
-            prs = list(first_nodes)
-            has_next = bool(page_info.get("hasNextPage"))
-            end_cursor = page_info.get("endCursor") or None
+        if self._progress:
+            self._progress.start_repository(repo_full_name)
+            self._progress.update_operation(f"Getting open PRs from {repo_full_name}")
 
-            # Include additional pages if present
-            if has_next:
-                async for pr_node in self._iter_repo_open_prs_pages(
-                    owner_n, name_n, end_cursor
-                ):
-                    prs.append(pr_node)
+        if not self._repo_has_open_prs(repo):
+            if self._progress:
+                self._progress.complete_repository(0)
+            return []
 
-            matching_prs_in_repo: list[tuple[PullRequestInfo, ComparisonResult]] = []
+        owner_n, name_n = repo_full_name.split("/", 1)
+        first_nodes, page_info = await self._fetch_repo_prs_first_page(owner_n, name_n)
+        prs = list(first_nodes)
+        has_next = bool(page_info.get("hasNextPage"))
+        end_cursor = page_info.get("endCursor") or None
 
-            for pr_node in prs:
-                target_pr = self.to_pull_request_info(repo_full_name, pr_node)
+        # Include additional pages if present
+        if has_next:
+            async for pr_node in self._iter_repo_open_prs_pages(
+                owner_n, name_n, end_cursor
+            ):
+                prs.append(pr_node)
 
-                # Skip the source PR itself
-                if (
-                    target_pr.number == source_pr.number
-                    and target_pr.repository_full_name == source_pr.repository_full_name
-                ):
+        matching_prs_in_repo: list[tuple[PullRequestInfo, ComparisonResult]] = []
+        # Optional comparator hooks (PRComparator provides them).
+        quick_reject = getattr(comparator, "quick_reject", None)
+        compare_many = getattr(comparator, "compare_many", None)
+
+        candidates: list[PullRequestInfo] = []
+        for pr_node in prs:
+            # Filter on the raw GraphQL node first: building the validated
+            # PullRequestInfo (with its file and review lists) is the
+            # costly step, and most open PRs are not candidates.
+
+            # Skip the source PR itself
+            if (
+                int(pr_node.get("number", 0)) == source_pr.number
+                and repo_full_name == source_pr.repository_full_name
+            ):
+                continue
+
+            # Candidate filtering
+            author_node = pr_node.get("author") or {}
+            author = canonical_bot_login(
+                author_node.get("login"), author_node.get("__typename")
+            )
+            if only_automation:
+                author_lower = author.lower()
+                is_auto = any(
+                    marker in author_lower for marker in _CANDIDATE_AUTOMATION_MARKERS
+                )
+                if not is_auto:
+                    continue
+            else:
+                if author != (source_pr.author or ""):
                     continue
 
-                # Candidate filtering
-                if only_automation:
-                    is_auto = any(
-                        bot in (target_pr.author or "").lower()
-                        for bot in [
-                            "dependabot",
-                            "renovate",
-                            "pre-commit",
-                            "github-actions",
-                            "bot",
-                        ]
-                    )
-                    if not is_auto:
-                        continue
-                else:
-                    if (target_pr.author or "") != (source_pr.author or ""):
-                        continue
+            target_pr = self.to_pull_request_info(repo_full_name, pr_node)
 
-                if self._progress:
-                    self._progress.analyze_pr(target_pr.number, repo_full_name)
+            if self._progress:
+                self._progress.analyze_pr(target_pr.number, repo_full_name)
+
+            # Cheap title-only rejection before the full comparison; skipped
+            # when debugging so every candidate still gets its breakdown.
+            if (
+                quick_reject is not None
+                and not self._debug_matching
+                and quick_reject(source_pr.title, target_pr.title)
+            ):
+                continue
+
+            candidates.append(target_pr)
 
-                comparison: ComparisonResult = comparator.compare_pull_requests(
-                    source_pr, target_pr, only_automation
+        # Score the repository's surviving candidates as one batch so the
+        # comparator can reuse source-side work across them.
+        comparisons: list[ComparisonResult]
+        if compare_many is not None:
+            comparisons = compare_many(source_pr, candidates, only_automation)
+        else:
+            comparisons = [
+                comparator.compare_pull_requests(source_pr, target_pr, only_automation)
+                for target_pr in candidates
+            ]
+
+        for target_pr, comparison in zip(candidates, comparisons, strict=True):
+            if self._debug_matching:
+                self._print_matching_debug(
+                    repo_full_name, source_pr, target_pr, comparator, comparison
                 )
 
-                # Debug matching output
-                if self._debug_matching:
-                    from rich.console import Console
+            if comparison.is_similar:
+                matching_prs_in_repo.append((target_pr, comparison))
 
-                    debug_console = Console()
-                    debug_console.print(
-                        f"\n🔍 [bold]Comparing {repo_full_name}#{target_pr.number}[/bold]"
-                    )
-                    debug_console.print(f"   Title: {target_pr.title}")
-                    debug_console.print(f"   Author: {target_pr.author}")
+        if self._progress:
+            self._progress.complete_repository(len(matching_prs_in_repo))
 
-                    # Show individual scores
-                    title_score = comparator._compare_titles(
-                        source_pr.title, target_pr.title
-                    )
-                    body_score = comparator._compare_bodies(
-                        source_pr.body, target_pr.body
-                    )
-                    files_score = comparator._compare_file_changes(
-                        source_pr.files_changed, target_pr.files_changed
-                    )
-                    author_score = (
-                        1.0
-                        if comparator._normalize_author(source_pr.author)
-                        == comparator._normalize_author(target_pr.author)
-                        else 0.0
-                    )
+        return matching_prs_in_repo
 
-                    debug_console.print(f"   📝 Title score: {title_score:.3f}")
-                    debug_console.print(f"   📄 Body score: {body_score:.3f}")
-                    debug_console.print(f"   📁 Files score: {files_score:.3f}")
-                    debug_console.print(f"   👤 Author score: {author_score:.3f}")
-                    debug_console.print(
-                        f"   🎯 Overall: {comparison.confidence_score:.3f} (threshold: 0.8)"
-                    )
+    def _print_matching_debug(
+        self,
+        repo_full_name: str,
+        source_pr: PullRequestInfo,
+        target_pr: PullRequestInfo,
+        comparator,
+        comparison: ComparisonResult,
+    ) -> None:
+        """Print the per-metric breakdown of one comparison (``--debug-matching``)."""
+        from rich.console import Console
 
-                    if comparison.is_similar:
-                        debug_console.print(
-                            f"   ✅ [green]SIMILAR[/green] - {', '.join(comparison.reasons)}"
-                        )
-                    else:
-                        debug_console.print("   ❌ [red]NOT SIMILAR[/red]")
+        debug_console = Console()
+        debug_console.print(
+            f"\n🔍 [bold]Comparing {repo_full_name}#{target_pr.number}[/bold]"
+        )
+        debug_console.print(f"   Title: {target_pr.title}")
+        debug_console.print(f"   Author: {target_pr.author}")
+
+        # Show individual scores
+        title_score = comparator._compare_titles(source_pr.title, target_pr.title)
+        body_score = comparator._compare_bodies(source_pr.body, target_pr.body)
+        files_score = comparator._compare_file_changes(
+            source_pr.files_changed, target_pr.files_changed
+        )
+        author_score = (
+            1.0
+            if comparator._normalize_author(source_pr.author)
+            == comparator._normalize_author(target_pr.author)
+            else 0.0
+        )
 
-                        # Show why it failed
-                        if title_score == 0:
-                            source_pkg = comparator._extract_package_name(
-                                source_pr.title
-                            )
-                            target_pkg = comparator._extract_package_name(
-                                target_pr.title
-                            )
-                            debug_console.print(
-                                f"      📦 Source package: '{source_pkg}'"
-                            )
-                            debug_console.print(
-                                f"      📦 Target package: '{target_pkg}'"
-                            )
+        debug_console.print(f"   📝 Title score: {title_score:.3f}")
+        debug_console.print(f"   📄 Body score: {body_score:.3f}")
+        debug_console.print(f"   📁 Files score: {files_score:.3f}")
+        debug_console.print(f"   👤 Author score: {author_score:.3f}")
+        # The comparator stops scoring a pair once it cannot reach the
+        # threshold, so recompute the overall from the full breakdown.
+        overall = (title_score + body_score + files_score + author_score) / 4
+        debug_console.print(f"   🎯 Overall: {overall:.3f} (threshold: 0.8)")
+
+        if comparison.is_similar:
+            debug_console.print(
+                f"   ✅ [green]SIMILAR[/green] - {', '.join(comparison.reasons)}"
+            )
+            return
 
-                        if body_score < 0.6:
-                            if target_pr.body is None:
-                                debug_console.print("      ⚠️ Target PR has no body")
-                            elif source_pr.body is None:
-                                debug_console.print("      ⚠️ Source PR has no body")
-                            else:
-                                debug_console.print(
-                                    f"      📄 Body comparison failed (score: {body_score:.3f})"
-                                )
-
-                if comparison.is_similar:
-                    matching_prs_in_repo.append((target_pr, comparison))
-                    if self._progress:
-                        # We can reuse 'found_similar_pr' if using MergeProgressTracker,
-                        # otherwise this call will be a no-op for ProgressTracker.
-                        try:
-                            self._progress.found_similar_pr()  # type: ignore[attr-defined]
-                        except Exception:
-                            # No-op when the tracker lacks this method or
-                            # the display update fails; counting is
-                            # cosmetic only.
-                            pass
-
-            results.extend(matching_prs_in_repo)
+        debug_console.print("   ❌ [red]NOT SIMILAR[/red]")
 
-            if self._progress:
-                self._progress.complete_repository(len(matching_prs_in_repo))
+        # Show why it failed
+        if title_score == 0:
+            source_pkg = comparator._extract_package_name(source_pr.title)
+            target_pkg = comparator._extract_package_name(target_pr.title)
+            debug_console.print(f"      📦 Source package: '{source_pkg}'")
+            debug_console.print(f"      📦 Target package: '{target_pkg}'")
 
-        return results
+        if body_score < 0.6:
+            if target_pr.body is None:
+                debug_console.print("      ⚠️ Target PR has no body")
+            elif source_pr.body is None:
+                debug_console.print("      ⚠️ Source PR has no body")
+            else:
+                debug_console.print(
+                    f"      📄 Body comparison failed (score: {body_score:.3f})"
+                )
 
     async def _collect_repo_open_prs(
         self,
@@ -1019,6 +1214,11 @@ class GitHubService:
                 if self._progress:
                     self._progress.start_repository(repo_full_name)
                 try:
+                    if not self._repo_has_open_prs(repo_node):
+                        if self._progress:
+                            self._progress.complete_repository(0)
+                        return [], []
+
                     repo_owner, repo_name = self._split_owner_repo(repo_full_name)
                     prs = await self._collect_repo_open_prs(
                         repo_owner, repo_name, only_automation=only_automation
@@ -1045,54 +1245,11 @@ class GitHubService:
 
         all_prs: list[PullRequestInfo] = []
         errors: list[str] = []
-
-        # Bounded producer/consumer pipeline.  A fixed pool of workers
-        # (sized to the repo-concurrency limit) drains repository nodes
-        # from a queue fed by the paginated iterator.  This caps in-flight
-        # work — both pending tasks and buffered nodes — instead of
-        # materialising one task per repository up front, which matters
-        # for owners with thousands of repositories.  A propagated
-        # rate-limit error from any worker tears the whole pipeline down
-        # (see the teardown below), preserving the global-throttle
-        # semantics of aborting the run rather than skipping repos.
-        worker_count = max(1, self._max_repo_tasks)
-        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
-            maxsize=worker_count * 2
-        )
-
-        async def producer() -> None:
-            async for repo in self._iter_owner_repositories(owner):
-                await queue.put(repo)
-            # One sentinel per worker so each terminates once the backlog
-            # drains.
-            for _ in range(worker_count):
-                await queue.put(None)
-
-        async def worker() -> None:
-            while True:
-                repo = await queue.get()
-                if repo is None:
-                    return
-                repo_prs, repo_errors = await process_repo(repo)
-                # Safe to mutate the shared lists without a lock: asyncio
-                # is single-threaded and ``extend`` does not await.
-                all_prs.extend(repo_prs)
-                errors.extend(repo_errors)
-
-        producer_task = asyncio.create_task(producer())
-        worker_tasks = [asyncio.create_task(worker()) for _ in range(worker_count)]
-        pipeline = [producer_task, *worker_tasks]
-        try:
-            # No return_exceptions: a propagated rate-limit error aborts
-            # the pipeline (the desired behaviour for global throttling).
-            await asyncio.gather(*pipeline)
-        except BaseException:
-            # Tear the pipeline down so no worker is left blocked on the
-            # queue, then re-raise the original (e.g. rate-limit) error.
-            for task in pipeline:
-                task.cancel()
-            await asyncio.gather(*pipeline, return_exceptions=True)
-            raise
+        for repo_prs, repo_errors in await self._run_repo_pipeline(
+            self._iter_owner_repositories(owner), process_repo
+        ):
+            all_prs.extend(repo_prs)
+            errors.extend(repo_errors)
 
         return all_prs, errors
 
@@ -1290,7 +1447,7 @@ class GitHubService:
                 f"Unexpected mergeStateStatus from GraphQL: {merge_state_status}"
             )
 
-        return normalized
+        return sys.intern(normalized)
 
     def _extract_file_changes(self, pr: dict[str, Any]) -> list[FileChange]:
         files = (pr.get("files") or {}).get("nodes", []) or []
@@ -4212,44 +4212,46 @@ class AsyncMergeManager:
             raise RuntimeError("GitHub client not initialized")
 
         try:
-            # Check if current user has already approved this PR
-            pr_data = await self._github_client.get(
-                f"/repos/{owner}/{repo}/pulls/{pr_number}"
-            )
-
-            if isinstance(pr_data, dict):
-                # Get current user login (cached on the client after the
-                # first call — the login is session-constant, so this
-                # costs one round-trip per run instead of one per PR).
-                current_user = await self._github_client.get_authenticated_user_login()
-
-                if current_user:
-                    reviews_data = await self._github_client.get(
-                        f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-                    )
-
-                    if isinstance(reviews_data, list):
-                        # Look for existing approval by current user
-                        for review in reviews_data:
-                            if (
-                                review.get("user", {}).get("login") == current_user
-                                and review.get("state") == "APPROVED"
-                            ):
-                                self.log.debug(
-                                    f"⏩ Already approved: {owner}/{repo}#{pr_number} [{current_user}]"
-                                )
-                                return False
+            # Get current user login (cached on the client after the
+            # first call — the login is session-constant, so this
+            # costs one round-trip per run instead of one per PR).
+            current_user = await self._github_client.get_authenticated_user_login()
+
+            if current_user:
+                reviews_data = await self._github_client.get(
+                    f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
+                )
 
-                        # Check if PR already has sufficient approvals from others
-                        approved_reviews = [
-                            review
-                            for review in reviews_data
-                            if review.get("state") == "APPROVED"
-                            and review.get("user", {}).get("login") != current_user
-                        ]
+                if isinstance(reviews_data, list):
+                    # Look for existing approval by current user
+                    for review in reviews_data:
+                        if (
+                            review.get("user", {}).get("login") == current_user
+                            and review.get("state") == "APPROVED"
+                        ):
+                            self.log.debug(
+                                f"⏩ Already approved: {owner}/{repo}#{pr_number} [{current_user}]"
+                            )
+                            return False
 
+                    # Check if PR already has sufficient approvals from others
+                    approved_reviews = [
+                        review
+                        for review in reviews_data
+                        if review.get("state") == "APPROVED"
+                        and review.get("user", {}).get("login") != current_user
+                    ]
+
+                    # The PR itself is only needed to read its mergeable
+                    # state, which matters only when someone else has
+                    # already approved; fetch it lazily so the common
+                    # unapproved case costs no extra round-trip.
+                    if approved_reviews:
+                        pr_data = await self._github_client.get(
+                            f"/repos/{owner}/{repo}/pulls/{pr_number}"
+                        )
                         if (
-                            approved_reviews
+                            isinstance(pr_data, dict)
                             and pr_data.get("mergeable_state") == "clean"
                         ):
                             approvers = [
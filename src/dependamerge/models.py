@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: 2025 The Linux Foundation
 
+from dataclasses import dataclass
 
 from pydantic import BaseModel
 
@@ -35,7 +36,14 @@ class ReviewComment(BaseModel):
     pull_request_review_state: str | None = None
 
 
-class FileChange(BaseModel):
+# FileChange and ComparisonResult are plain slotted dataclasses rather than
+# Pydantic models: they are built in bulk from already-typed API data (one
+# per changed file, one per candidate PR) and never serialised, so
+# validation buys nothing and slots keep each instance small.  Pydantic
+# models that hold them (``PullRequestInfo.files_changed``) keep the
+# instances as-is.
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FileChange:
     """Represents a file change in a pull request."""
 
     filename: str
@@ -76,7 +84,8 @@ class PullRequestInfo(BaseModel):
     maintainer_can_modify: bool | None = None
 
 
-class ComparisonResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ComparisonResult:
     """Result of comparing two pull requests."""
 
     is_similar: bool
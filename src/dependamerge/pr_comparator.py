@@ -3,10 +3,83 @@
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from .bot_identity import normalize_bot_login
 from .models import ComparisonResult, FileChange, PullRequestInfo
 
+# Normalization patterns, compiled once at module level: they run for
+# every candidate PR in an owner-wide scan.
+_VERSION_RE = re.compile(r"v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9]+)?")
+_HASH_RE = re.compile(r"\b[a-f0-9]{7,40}\b")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_FNAME_VER_RE = re.compile(r"v?\d+\.\d+\.\d+(?:\.\d+)?")
+_URL_RE = re.compile(r"https?://[^\s]+")
+_BODY_VERSION_RE = re.compile(r"v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9.-]+)?")
+_PR_NUMBER_RE = re.compile(r"#\d+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Common dependency update patterns, tried in order.
+_PACKAGE_UPDATE_PATTERNS = (
+    # "Bump package from X to Y" or "Chore: Bump package from X to Y"
+    re.compile(r"(?:chore:\s*)?bump\s+([^\s]+)\s+from\s+"),
+    # "Update package from X to Y"
+    re.compile(r"(?:chore:\s*)?update\s+([^\s]+)\s+from\s+"),
+    # "Upgrade package from X to Y"
+    re.compile(r"(?:chore:\s*)?upgrade\s+([^\s]+)\s+from\s+"),
+)
+_QUOTE_RE = re.compile(r'^["\']|["\']$')
+
+# Package/action names quoted in automation PR bodies.
+_DEPENDENCY_NAME_RE = re.compile(r"dependency-name:\s*([^\s\n]+)", re.IGNORECASE)
+_BUMPS_PACKAGE_RE = re.compile(r"bumps\s+\[([^\]]+)\]", re.IGNORECASE)
+_USES_ACTION_RE = re.compile(r"uses:\s*([^@\s]+)", re.IGNORECASE)
+
+# Automation markers in a PR's title, body or author, most frequent first.
+_AUTOMATION_INDICATORS = (
+    "dependabot",
+    "bot",
+    "renovate",
+    "pre-commit",
+    "github-actions",
+    "auto-update",
+    "automated",
+)
+
+# Upper bound on the files of one PR that take part in similarity
+# matching.  Automation PRs touch a handful of files; the cap only bites
+# on mega-PRs (GitHub lists up to 3000 files), where the first few
+# hundred already decide the Jaccard score.  PullRequestInfo keeps the
+# full list for callers such as the workflow-scope pre-flight check.
+MAX_FILES_FOR_COMPARE = 300
+
+
+def _sequence_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """Return ``SequenceMatcher(None, a, b).ratio()``, skipping trivial cases.
+
+    Identical strings always score 1.0, and a pair where only one side is
+    empty always scores 0.0, so neither needs the quadratic matching pass.
+    Automation PRs very often normalize to identical titles and bodies.
+
+    With ``score_cutoff``, a ratio below the cutoff is reported as 0.0
+    (the same contract as rapidfuzz's ``score_cutoff``).  That lets pairs
+    be dismissed on difflib's cheap upper bounds -- ``real_quick_ratio``
+    (lengths only) and ``quick_ratio`` (character multiset) -- without
+    running the full matching pass.
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    matcher = SequenceMatcher(None, a, b)
+    if score_cutoff > 0.0 and (
+        matcher.real_quick_ratio() < score_cutoff
+        or matcher.quick_ratio() < score_cutoff
+    ):
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
+
 
 class PRComparator:
     """Compare pull requests to determine if they contain similar changes."""
@@ -21,10 +94,31 @@ class PRComparator:
         target_pr: PullRequestInfo,
         only_automation: bool = True,
     ) -> ComparisonResult:
-        """Compare two pull requests and determine similarity."""
-        reasons = []
-        scores = []
+        """Compare two pull requests and determine similarity.
+
+        The four scores (title, body, files, author; each in ``[0, 1]``)
+        are averaged against ``similarity_threshold``.  They are computed
+        cheapest first -- author, files, title, body -- and scoring stops
+        as soon as perfect scores on the remaining metrics could no
+        longer reach the threshold.  Such a rejected pair is not similar
+        and reports the average of the metrics actually scored as its
+        confidence, with reasons for those metrics.
+        """
+        return self._compare(
+            source_pr,
+            target_pr,
+            only_automation,
+            self._filename_set(source_pr.files_changed),
+        )
 
+    def _compare(
+        self,
+        source_pr: PullRequestInfo,
+        target_pr: PullRequestInfo,
+        only_automation: bool,
+        source_filenames: frozenset[str],
+    ) -> ComparisonResult:
+        """Score one pair, given the source's normalized filename set."""
         # Check automation requirements based on mode
         if only_automation:
             # Both PRs must be from automation tools
@@ -41,60 +135,159 @@ class PRComparator:
             # so we don't need additional automation checks here
             pass
 
+        # Total score a pair must reach; the tolerance keeps float rounding
+        # from ever cutting short a pair that would have matched.
+        needed = self.similarity_threshold * 4 - 1e-9
+
+        # Compare authors (normalize bot names to handle API differences)
+        if source_pr.author == target_pr.author:
+            author_score = 1.0
+        else:
+            source_author = self._normalize_author(source_pr.author)
+            target_author = self._normalize_author(target_pr.author)
+            author_score = 1.0 if source_author == target_author else 0.0
+        if author_score + 3.0 < needed:
+            return self._build_result(author_score=author_score)
+
+        # Compare file changes
+        files_score = self._compare_filename_sets(
+            source_filenames, self._filename_set(target_pr.files_changed)
+        )
+        if author_score + files_score + 2.0 < needed:
+            return self._build_result(
+                files_score=files_score, author_score=author_score
+            )
+
         # Compare titles
         title_score = self._compare_titles(source_pr.title, target_pr.title)
-        scores.append(title_score)
-        if title_score > 0.7:
-            reasons.append(f"Similar titles (score: {title_score:.2f})")
+        if author_score + files_score + title_score + 1.0 < needed:
+            return self._build_result(
+                title_score=title_score,
+                files_score=files_score,
+                author_score=author_score,
+            )
 
         # Compare PR bodies for additional context
         body_score = self._compare_bodies(source_pr.body, target_pr.body)
-        scores.append(body_score)
-        if body_score > 0.6:
-            reasons.append(f"Similar PR descriptions (score: {body_score:.2f})")
 
-        # Compare file changes
-        files_score = self._compare_file_changes(
-            source_pr.files_changed, target_pr.files_changed
+        return self._build_result(
+            title_score=title_score,
+            body_score=body_score,
+            files_score=files_score,
+            author_score=author_score,
         )
-        scores.append(files_score)
-        if files_score > 0.6:
-            reasons.append(f"Similar file changes (score: {files_score:.2f})")
 
-        # Compare authors (normalize bot names to handle API differences)
-        source_author = self._normalize_author(source_pr.author)
-        target_author = self._normalize_author(target_pr.author)
-        if source_author == target_author:
-            scores.append(1.0)
+    def _build_result(
+        self,
+        *,
+        author_score: float,
+        title_score: float | None = None,
+        body_score: float | None = None,
+        files_score: float | None = None,
+    ) -> ComparisonResult:
+        """Assemble a ComparisonResult from the metrics scored so far.
+
+        Unscored metrics are left out of the average, so a short-circuited
+        pair reports the confidence it actually earned.  Such a pair is
+        never similar.
+        """
+        reasons = []
+        if title_score is not None and title_score > 0.7:
+            reasons.append(f"Similar titles (score: {title_score:.2f})")
+        if body_score is not None and body_score > 0.6:
+            reasons.append(f"Similar PR descriptions (score: {body_score:.2f})")
+        if files_score is not None and files_score > 0.6:
+            reasons.append(f"Similar file changes (score: {files_score:.2f})")
+        if author_score == 1.0:
             reasons.append("Same automation author")
-        else:
-            scores.append(0.0)
+
+        scores = [
+            score
+            for score in (title_score, body_score, files_score)
+            if score is not None
+        ]
+        scores.append(author_score)
 
         # Calculate overall confidence score
-        confidence_score = sum(scores) / len(scores) if scores else 0.0
-        is_similar = confidence_score >= self.similarity_threshold
+        confidence_score = sum(scores) / len(scores)
+        is_similar = len(scores) == 4 and confidence_score >= self.similarity_threshold
 
         return ComparisonResult(
             is_similar=is_similar, confidence_score=confidence_score, reasons=reasons
         )
 
-    def _is_automation_pr(self, pr: PullRequestInfo) -> bool:
-        """Check if PR is from an automation tool."""
-        automation_indicators = [
-            "dependabot",
-            "pre-commit",
-            "renovate",
-            "github-actions",
-            "auto-update",
-            "automated",
-            "bot",
+    def compare_many(
+        self,
+        source_pr: PullRequestInfo,
+        targets: list[PullRequestInfo],
+        only_automation: bool = True,
+    ) -> list[ComparisonResult]:
+        """Compare ``source_pr`` against each of ``targets``, in order.
+
+        Equivalent to calling :meth:`compare_pull_requests` per target.
+        A source that is not from automation is rejected once for the
+        whole batch, and the source's title, body and filename
+        normalization is computed once and reused for every target
+        (memoised normalizers, one filename set built up front).
+        """
+        if only_automation and not self._is_automation_pr(source_pr):
+            return [
+                ComparisonResult(
+                    is_similar=False,
+                    confidence_score=0.0,
+                    reasons=["One or both PRs are not from automation tools"],
+                )
+                for _ in targets
+            ]
+        source_filenames = self._filename_set(source_pr.files_changed)
+        return [
+            self._compare(source_pr, target, only_automation, source_filenames)
+            for target in targets
         ]
 
-        pr_text = f"{pr.title} {pr.body or ''} {pr.author}".lower()
-        return any(indicator in pr_text for indicator in automation_indicators)
+    def quick_reject(self, source_title: str, candidate_title: str) -> bool:
+        """Return True when two PRs cannot be similar, judging by title alone.
+
+        ``compare_pull_requests`` averages four scores in ``[0, 1]``, so a
+        pair whose title score stays below the threshold even with perfect
+        body, file and author scores can never be similar.  Title scoring
+        is far cheaper than body normalization and matching, and rejects
+        the common case of dependency updates for different packages
+        (title score 0.0) outright.  Never rejects a pair that
+        ``compare_pull_requests`` would accept.
+        """
+        # Title score needed to reach the threshold when body, files and
+        # author all score 1.0.  The small tolerance means float rounding
+        # can only err towards a full comparison, never towards a false
+        # rejection.
+        needed = 4 * self.similarity_threshold - 3.0 - 4e-9
+        title_score = self._compare_titles(
+            source_title, candidate_title, score_cutoff=needed
+        )
+        return title_score < needed
 
-    def _compare_titles(self, title1: str, title2: str) -> float:
-        """Compare PR titles for similarity."""
+    def _is_automation_pr(self, pr: PullRequestInfo) -> bool:
+        """Check if PR is from an automation tool."""
+        return self._has_automation_marker(pr.title, pr.body, pr.author)
+
+    # Keyed on the field values, so an updated or copied PR is never
+    # judged by stale text.  The source PR is checked once per candidate;
+    # bodies can be large, so keep just a handful.
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _has_automation_marker(title: str, body: str | None, author: str) -> bool:
+        """Check the casefolded title, body and author for automation markers."""
+        text = f"{title} {body or ''} {author}".casefold()
+        return any(indicator in text for indicator in _AUTOMATION_INDICATORS)
+
+    def _compare_titles(
+        self, title1: str, title2: str, score_cutoff: float = 0.0
+    ) -> float:
+        """Compare PR titles for similarity.
+
+        Scores below ``score_cutoff`` are reported as 0.0; see
+        :func:`_sequence_ratio`.
+        """
         # For dependency updates, check if they're updating the same package
         package1 = self._extract_package_name(title1)
         package2 = self._extract_package_name(title2)
@@ -106,79 +299,106 @@ class PRComparator:
             else:
                 return 0.0  # Different packages - not similar
 
-        # Fall back to original logic for non-dependency updates
+        # Fall back to original logic for non-dependency updates.  Version
+        # bumps never get here: the package check above decides them.
         normalized1 = self._normalize_title(title1)
         normalized2 = self._normalize_title(title2)
 
-        return SequenceMatcher(None, normalized1, normalized2).ratio()
+        return _sequence_ratio(normalized1, normalized2, score_cutoff)
 
-    def _normalize_title(self, title: str) -> str:
+    # Title and filename normalization are pure and are re-run for the
+    # same source PR against every candidate in an owner-wide scan, so
+    # results are memoised (shared across comparator instances).
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_title(title: str) -> str:
         """Normalize title by removing version-specific information."""
+        # The three passes below are deliberately sequential rather than one
+        # alternation: stripping a version can expose a hash at a new word
+        # boundary ("deadbeef1.2.3"), which a single pass would leave behind.
         # Remove version numbers like 1.2.3, v1.2.3, etc.
-        title = re.sub(r"v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9]+)?", "", title)
+        title = _VERSION_RE.sub("", title)
         # Remove commit hashes
-        title = re.sub(r"\b[a-f0-9]{7,40}\b", "", title)
+        title = _HASH_RE.sub("", title)
         # Remove dates
-        title = re.sub(r"\d{4}-\d{2}-\d{2}", "", title)
+        title = _DATE_RE.sub("", title)
         # Normalize whitespace
         title = " ".join(title.split())
         return title.lower()
 
     def _compare_file_changes(self, files1: list[FileChange], files2: list[FileChange]) -> float:
         """Compare file changes between PRs."""
-        if not files1 or not files2:
-            return 0.0
-
         # Extract filenames and normalize paths
-        filenames1 = {self._normalize_filename(f.filename) for f in files1}
-        filenames2 = {self._normalize_filename(f.filename) for f in files2}
+        return self._compare_filename_sets(
+            self._filename_set(files1), self._filename_set(files2)
+        )
 
-        # Calculate Jaccard similarity
-        intersection = len(filenames1.intersection(filenames2))
-        union = len(filenames1.union(filenames2))
+    @staticmethod
+    def _filename_set(files: list[FileChange]) -> frozenset[str]:
+        """Normalized filenames of ``files``, up to ``MAX_FILES_FOR_COMPARE``."""
+        return frozenset(
+            PRComparator._normalize_filename(f.filename)
+            for f in files[:MAX_FILES_FOR_COMPARE]
+        )
 
-        # For GitHub Actions workflows, consider them similar if both modify workflow files
-        # This handles cases where different repos have different workflow names
-        workflows1 = {f for f in filenames1 if f.startswith(".github/workflows/")}
-        workflows2 = {f for f in filenames2 if f.startswith(".github/workflows/")}
+    def _compare_filename_sets(
+        self, filenames1: frozenset[str], filenames2: frozenset[str]
+    ) -> float:
+        """Return the Jaccard index of two sets of normalized filenames.
+
+        Pairs that both touch workflow files score at least 0.5.
+        """
+        if not filenames1 or not filenames2:
+            return 0.0
 
-        if workflows1 and workflows2:
+        # Calculate Jaccard similarity.  |A ∪ B| = |A| + |B| - |A ∩ B|, so
+        # the union never needs to be materialised.
+        intersection = len(filenames1 & filenames2)
+        union = len(filenames1) + len(filenames2) - intersection
+        jaccard = intersection / union
+
+        # For GitHub Actions workflows, consider them similar if both modify workflow files
+        # This handles cases where different repos have different workflow names.
+        # The floor cannot raise a score already at 0.5, so the per-file
+        # prefix scans only run when it could.
+        if (
+            jaccard < 0.5
+            and any(f.startswith(".github/workflows/") for f in filenames1)
+            and any(f.startswith(".github/workflows/") for f in filenames2)
+        ):
             # Both PRs modify GitHub Actions workflows - consider this a partial match
-            return max(intersection / union if union > 0 else 0.0, 0.5)
+            return max(jaccard, 0.5)
 
-        return intersection / union if union > 0 else 0.0
+        return jaccard
 
-    def _normalize_filename(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_filename(filename: str) -> str:
         """Normalize filename for comparison."""
         # Remove version-specific parts from filenames
-        filename = re.sub(r"v?\d+\.\d+\.\d+(?:\.\d+)?", "", filename)
+        filename = _FNAME_VER_RE.sub("", filename)
         return filename.lower()
 
-    def _extract_package_name(self, title: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_package_name(title: str) -> str:
         """Extract package name from dependency update titles.
 
         Returns empty string if not a recognized dependency update pattern.
+        The templates are matched whatever the PR's author: Dependabot,
+        pre-commit.ci and people bumping by hand share them, so keying the
+        parser on the author would only miss matches.
         """
         title_lower = title.lower()
 
-        # Common dependency update patterns
-        patterns = [
-            # "Bump package from X to Y" or "Chore: Bump package from X to Y"
-            r"(?:chore:\s*)?bump\s+([^\s]+)\s+from\s+",
-            # "Update package from X to Y"
-            r"(?:chore:\s*)?update\s+([^\s]+)\s+from\s+",
-            # "Upgrade package from X to Y"
-            r"(?:chore:\s*)?upgrade\s+([^\s]+)\s+from\s+",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title_lower)
+        for pattern in _PACKAGE_UPDATE_PATTERNS:
+            match = pattern.search(title_lower)
             if match:
                 package = match.group(1)
                 # Clean up the package name
                 package = package.strip()
                 # Remove common prefixes that might vary
-                package = re.sub(r'^["\']|["\']$', "", package)  # Remove quotes
+                package = _QUOTE_RE.sub("", package)  # Remove quotes
                 return package
 
         return ""
@@ -202,9 +422,13 @@ class PRComparator:
             return automation_score
 
         # Fall back to sequence matching for general similarity
-        return SequenceMatcher(None, normalized1, normalized2).ratio()
+        return _sequence_ratio(normalized1, normalized2)
 
-    def _normalize_body(self, body: str | None) -> str:
+    # Only the source PR's body repeats (once per candidate), and bodies
+    # can be large, so keep just a handful.
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _normalize_body(body: str | None) -> str:
         """Normalize PR body by removing version-specific and variable content."""
         if not body:
             return ""
@@ -213,22 +437,22 @@ class PRComparator:
         body = body.lower()
 
         # Remove URLs (they often contain version-specific paths)
-        body = re.sub(r"https?://[^\s]+", "", body)
+        body = _URL_RE.sub("", body)
 
         # Remove version numbers
-        body = re.sub(r"v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9.-]+)?", "VERSION", body)
+        body = _BODY_VERSION_RE.sub("VERSION", body)
 
         # Remove commit hashes
-        body = re.sub(r"\b[a-f0-9]{7,40}\b", "COMMIT", body)
+        body = _HASH_RE.sub("COMMIT", body)
 
         # Remove dates
-        body = re.sub(r"\d{4}-\d{2}-\d{2}", "DATE", body)
+        body = _DATE_RE.sub("DATE", body)
 
         # Remove specific numbers that might be build/PR numbers
-        body = re.sub(r"#\d+", "#NUMBER", body)
+        body = _PR_NUMBER_RE.sub("#NUMBER", body)
 
         # Normalize whitespace
-        body = re.sub(r"\s+", " ", body).strip()
+        body = _WHITESPACE_RE.sub(" ", body).strip()
 
         return body
 
@@ -291,12 +515,12 @@ class PRComparator:
             return ""
 
         # Look for "dependency-name: package" pattern in YAML frontmatter
-        yaml_match = re.search(r"dependency-name:\s*([^\s\n]+)", body, re.IGNORECASE)
+        yaml_match = _DEPENDENCY_NAME_RE.search(body)
         if yaml_match:
             return yaml_match.group(1).strip()
 
         # Look for "Bumps [package]" pattern
-        bump_match = re.search(r"bumps\s+\[([^\]]+)\]", body, re.IGNORECASE)
+        bump_match = _BUMPS_PACKAGE_RE.search(body)
         if bump_match:
             return bump_match.group(1).strip()
 
@@ -349,7 +573,7 @@ class PRComparator:
             return ""
 
         # Look for "uses: action/name@version" pattern
-        uses_match = re.search(r"uses:\s*([^@\s]+)", body, re.IGNORECASE)
+        uses_match = _USES_ACTION_RE.search(body)
         if uses_match:
             return uses_match.group(1).strip()
 
@@ -319,3 +319,61 @@ class TestEnsurePrApproved:
 
         assert approved is False
         assert "owner/repo#42" not in mgr._recently_approved
+
+
+# ---------------------------------------------------------------------------
+# _approve_pr request count
+# ---------------------------------------------------------------------------
+
+
+class TestApprovePrLookups:
+    """The PR is fetched only when another reviewer already approved."""
+
+    @staticmethod
+    def _client_with_reviews(client: AsyncMock, reviews: list) -> list[str]:
+        calls: list[str] = []
+
+        async def fake_get(url: str):
+            calls.append(url)
+            if url.endswith("/reviews"):
+                return reviews
+            return {"mergeable_state": "clean"}
+
+        client.get = AsyncMock(side_effect=fake_get)
+        client.get_authenticated_user_login = AsyncMock(return_value="me")
+        client.approve_pull_request = AsyncMock()
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_unapproved_pr_skips_pr_fetch(self) -> None:
+        mgr, client = make_merge_manager()
+        calls = self._client_with_reviews(client, [])
+
+        assert await mgr._approve_pr("owner", "repo", 42) is True
+        assert calls == ["/repos/owner/repo/pulls/42/reviews"]
+        client.approve_pull_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_own_approval_skips_pr_fetch(self) -> None:
+        mgr, client = make_merge_manager()
+        calls = self._client_with_reviews(
+            client, [{"user": {"login": "me"}, "state": "APPROVED"}]
+        )
+
+        assert await mgr._approve_pr("owner", "repo", 42) is False
+        assert calls == ["/repos/owner/repo/pulls/42/reviews"]
+        client.approve_pull_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_other_approval_on_clean_pr_is_sufficient(self) -> None:
+        mgr, client = make_merge_manager()
+        calls = self._client_with_reviews(
+            client, [{"user": {"login": "alice"}, "state": "APPROVED"}]
+        )
+
+        assert await mgr._approve_pr("owner", "repo", 42) is False
+        assert calls == [
+            "/repos/owner/repo/pulls/42/reviews",
+            "/repos/owner/repo/pulls/42",
+        ]
+        client.approve_pull_request.assert_not_awaited()
@@ -44,6 +44,15 @@ class TestGitHubAsyncCore:
         finally:
             await api.aclose()
 
+    def test_connection_pool_sized_to_concurrency(self):
+        """The httpx pool keeps one kept-alive connection per request slot."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            GitHubAsync(token="test_token", max_concurrency=40)
+
+            limits = mock_client_class.call_args.kwargs["limits"]
+            assert limits.max_keepalive_connections == 40
+            assert limits.keepalive_expiry == GitHubAsync._KEEPALIVE_EXPIRY
+
     @pytest.mark.asyncio
     async def test_concurrent_requests_with_semaphore(self):
         """Test that concurrent requests are properly limited by semaphore."""
@@ -169,6 +178,113 @@ class TestGitHubAsyncCore:
             finally:
                 await api.aclose()
 
+    @pytest.mark.asyncio
+    async def test_conditional_get_serves_cached_body_on_304(self):
+        """A stored ETag is revalidated and a 304 reuses the cached body."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            first_response = Mock()
+            first_response.status_code = 200
+            first_response.json.return_value = {"number": 7}
+            first_response.content = b'{"number": 7}'
+            first_response.headers = {"ETag": '"abc"'}
+
+            not_modified = Mock()
+            not_modified.status_code = 304
+            not_modified.headers = {"ETag": '"abc"'}
+
+            mock_client.request.side_effect = [first_response, not_modified]
+
+            etag_cache: dict = {}
+            api = GitHubAsync(token="test_token", etag_cache=etag_cache)
+            try:
+                first = await api.get("/repos/o/r/pulls/7")
+                assert first == {"number": 7}
+                # Callers may modify a result without touching the cache.
+                first["number"] = 8
+                assert await api.get("/repos/o/r/pulls/7") == {"number": 7}
+
+                first_call, second_call = mock_client.request.call_args_list
+                assert "headers" not in first_call.kwargs
+                assert second_call.kwargs["headers"] == {"If-None-Match": '"abc"'}
+                not_modified.json.assert_not_called()
+            finally:
+                await api.aclose()
+
+    @pytest.mark.asyncio
+    async def test_etag_cache_is_bounded(self):
+        """The least recently used ETag entry is dropped past the bound."""
+        with (
+            patch("httpx.AsyncClient") as mock_client_class,
+            patch.object(GitHubAsync, "_ETAG_CACHE_MAX_ENTRIES", 2),
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {}
+            response.content = b"{}"
+            response.headers = {"ETag": '"abc"'}
+            mock_client.request.return_value = response
+
+            etag_cache: dict = {}
+            api = GitHubAsync(token="test_token", etag_cache=etag_cache)
+            try:
+                for number in (1, 2, 3):
+                    await api.get(f"/repos/o/r/pulls/{number}")
+
+                assert [key.rsplit("/", 1)[1] for key in etag_cache] == ["2", "3"]
+            finally:
+                await api.aclose()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_response_updates_rate_limit_state(self):
+        """A 304 still drives adaptive throttling and metrics reporting."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            first_response = Mock()
+            first_response.status_code = 200
+            first_response.json.return_value = {"number": 7}
+            first_response.content = b'{"number": 7}'
+            first_response.headers = {
+                "ETag": '"abc"',
+                "X-RateLimit-Remaining": "5000",
+                "X-RateLimit-Limit": "5000",
+            }
+
+            not_modified = Mock()
+            not_modified.status_code = 304
+            not_modified.headers = {
+                "ETag": '"abc"',
+                "X-RateLimit-Remaining": "10",
+                "X-RateLimit-Limit": "5000",
+            }
+
+            mock_client.request.side_effect = [first_response, not_modified]
+
+            on_metrics = Mock()
+            api = GitHubAsync(
+                token="test_token",
+                max_concurrency=10,
+                etag_cache={},
+                on_metrics=on_metrics,
+            )
+            try:
+                await api.get("/repos/o/r/pulls/7")
+                on_metrics.reset_mock()
+
+                assert await api.get("/repos/o/r/pulls/7") == {"number": 7}
+
+                assert api._max_concurrency == 5
+                on_metrics.assert_called_once_with(5, api._current_rps)
+            finally:
+                await api.aclose()
+
 
 class TestGitHubServiceAsync:
     """Test async patterns in GitHubService."""
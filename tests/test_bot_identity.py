@@ -44,6 +44,13 @@ class TestCanonicalBotLogin:
         assert canonical_bot_login(None, "Bot") == "unknown"
         assert canonical_bot_login("", "Bot") == "unknown"
 
+    def test_result_is_interned(self) -> None:
+        # Every PR from the same bot shares one login string.
+        suffixed = canonical_bot_login("".join(["dependa", "bot"]), "Bot")
+        assert suffixed is canonical_bot_login("dependabot", "Bot")
+        plain = canonical_bot_login("".join(["octo", "cat"]), "User")
+        assert plain is canonical_bot_login("octocat", "User")
+
 
 class TestNormalizeBotLogin:
     @pytest.mark.parametrize(
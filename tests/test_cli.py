@@ -8,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from dependamerge.cli import (
+    SIMILAR_PR_SCAN_WORKERS,
     _format_failure_reason,
     _generate_override_sha,
     _MergeContext,
@@ -36,6 +37,30 @@ class TestCLI:
         with patch("dependamerge.cli._check_merge_permissions") as mock_check:
             yield mock_check
 
+    @pytest.fixture(autouse=True)
+    def _no_live_github(self):
+        """Keep the merge and close managers off the network.
+
+        Tests here mock ``GitHubClient`` and the scan service, but the
+        managers build their own ``GitHubAsync`` / ``GitHubService``.
+        Left real, those issue GitHub calls with the dummy token, and
+        where the network is unreachable every call retries with
+        backoff, adding minutes to the module.  Tests that configure
+        ``merge_manager.GitHubAsync`` themselves still override this.
+        """
+        with (
+            patch("dependamerge.merge_manager.GitHubService") as service_class,
+            patch("dependamerge.merge_manager.GitHubAsync"),
+            patch("dependamerge.close_manager.GitHubAsync"),
+        ):
+            service = AsyncMock()
+            service.get_branch_protection_settings.return_value = None
+            service.determine_merge_method = Mock(
+                side_effect=lambda _settings, default: default
+            )
+            service_class.return_value = service
+            yield
+
     def setup_method(self):
         self.runner = CliRunner()
 
@@ -158,6 +183,10 @@ class TestCLI:
 
         assert result.exit_code == 0
         assert "Dependamerge Evaluation" in result.stdout
+        # The owner-wide scan runs with the widened repository worker pool.
+        assert mock_service_class.call_args_list[0].kwargs["max_repo_tasks"] == (
+            SIMILAR_PR_SCAN_WORKERS
+        )
 
     def test_merge_command_invalid_url(self):
         """Test that invalid URLs are caught by the URL parser."""
@@ -192,6 +221,22 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Invalid --max-wait" in result.stdout
 
+    def test_merge_command_rejects_max_matches_for_owner_url(self):
+        result = self.runner.invoke(
+            app,
+            [
+                "merge",
+                "https://github.com/owner",
+                "--token",
+                "test_token",
+                "--max-matches",
+                "3",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid --max-matches" in result.stdout
+
     @patch("dependamerge.cli.GitHubClient")
     def test_merge_command_non_automation_pr(self, mock_client_class):
         mock_client = Mock()
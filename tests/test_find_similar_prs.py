@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2026 The Linux Foundation
+
+"""Tests for the owner-wide similar-PR scan in ``GitHubService``."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from dependamerge.github_async import RateLimitError
+from dependamerge.github_service import GitHubService
+from dependamerge.models import FileChange, PullRequestInfo
+from dependamerge.pr_comparator import PRComparator
+
+
+def _source_pr() -> PullRequestInfo:
+    return PullRequestInfo(
+        number=1,
+        title="Bump requests from 2.28.0 to 2.28.1",
+        body="Bumps requests from 2.28.0 to 2.28.1",
+        author="dependabot[bot]",
+        head_sha="abc123",
+        base_branch="main",
+        head_branch="dependabot/pip/requests-2.28.1",
+        state="open",
+        mergeable=True,
+        mergeable_state="clean",
+        behind_by=0,
+        files_changed=[
+            FileChange(
+                filename="requirements.txt",
+                additions=1,
+                deletions=1,
+                changes=2,
+                status="modified",
+            )
+        ],
+        repository_full_name="acme/source",
+        html_url="https://github.com/acme/source/pull/1",
+    )
+
+
+def _pr_node(number: int, title: str = "Bump requests from 2.27.0 to 2.28.1"):
+    return {
+        "id": f"PR_{number}",
+        "number": number,
+        "title": title,
+        "body": "Bumps requests from 2.27.0 to 2.28.1",
+        "url": f"https://github.com/acme/repo/pull/{number}",
+        "author": {"__typename": "Bot", "login": "dependabot"},
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+        "baseRefName": "main",
+        "headRefName": "dependabot/pip/requests-2.28.1",
+        "headRefOid": "def456",
+        "files": {"nodes": [{"path": "requirements.txt"}]},
+    }
+
+
+def _make_service(repos, pr_nodes=None, *, delay: float = 0.0, max_repo_tasks=4):
+    """Return a GitHubService over canned repositories, plus a scan log.
+
+    ``repos`` holds repository names or full repository nodes, and every
+    repository's first PR page is ``pr_nodes`` (one candidate by default).
+    The log records the repositories whose PRs were queried, the peak
+    number of concurrent queries and an event set on the first query.
+    """
+    svc = GitHubService(token="test_token", max_repo_tasks=max_repo_tasks)
+    nodes = [_pr_node(7)] if pr_nodes is None else pr_nodes
+    log = SimpleNamespace(scanned=[], peak=0, first_scan=asyncio.Event())
+    in_flight = 0
+
+    async def fake_iter(org):
+        for repo in repos:
+            yield {"nameWithOwner": repo} if isinstance(repo, str) else repo
+
+    async def fake_first_page(owner, name):
+        nonlocal in_flight
+        log.scanned.append(name)
+        log.first_scan.set()
+        in_flight += 1
+        log.peak = max(log.peak, in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            in_flight -= 1
+        return nodes, {"hasNextPage": False}
+
+    svc._iter_org_repositories_with_open_prs = fake_iter  # type: ignore[assignment]
+    svc._fetch_repo_prs_first_page = fake_first_page  # type: ignore[assignment]
+    return svc, log
+
+
+async def _scan(svc, comparator=None, **kwargs):
+    """Run the similar-PR scan for ``_source_pr`` and close the service."""
+    try:
+        return await svc.find_similar_prs(
+            "acme",
+            _source_pr(),
+            comparator or PRComparator(),
+            only_automation=True,
+            **kwargs,
+        )
+    finally:
+        await svc.close()
+
+
+class TestFindSimilarPrsConcurrency:
+    @pytest.mark.asyncio
+    async def test_repositories_scanned_concurrently(self):
+        names = [f"acme/repo{i}" for i in range(8)]
+        svc, log = _make_service(names, delay=0.01)
+
+        results = await _scan(svc)
+
+        assert len(results) == 8
+        # Bounded by max_repo_tasks, but more than one at a time.
+        assert 1 < log.peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_results_keep_repository_order(self):
+        names = [f"acme/repo{i}" for i in range(5)]
+        svc, _ = _make_service(names)
+
+        results = await _scan(svc)
+
+        assert [pr.repository_full_name for pr, _ in results] == names
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_remaining_scans(self):
+        svc, _ = _make_service(["acme/alpha", "acme/beta"])
+
+        async def failing_first_page(owner, name):
+            if name == "alpha":
+                raise RateLimitError("primary rate limit")
+            await asyncio.sleep(10)
+            return [], {}
+
+        svc._fetch_repo_prs_first_page = failing_first_page  # type: ignore[assignment]
+
+        with pytest.raises(RateLimitError):
+            await asyncio.wait_for(_scan(svc), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_scanning_starts_before_enumeration_finishes(self):
+        svc, log = _make_service([])
+
+        async def gated_iter(org):
+            yield {"nameWithOwner": "acme/alpha"}
+            # The second page of repositories only "arrives" once the
+            # first repository has already been scanned.
+            await asyncio.wait_for(log.first_scan.wait(), timeout=5)
+            yield {"nameWithOwner": "acme/beta"}
+
+        svc._iter_org_repositories_with_open_prs = gated_iter  # type: ignore[assignment]
+
+        results = await _scan(svc)
+
+        assert [pr.repository_full_name for pr, _ in results] == [
+            "acme/alpha",
+            "acme/beta",
+        ]
+
+
+class TestSkipReposWithoutOpenPrs:
+    @pytest.mark.asyncio
+    async def test_repo_with_zero_open_prs_is_not_queried(self):
+        svc, log = _make_service(
+            [
+                {"nameWithOwner": "acme/empty", "pullRequests": {"totalCount": 0}},
+                {"nameWithOwner": "acme/busy", "pullRequests": {"totalCount": 1}},
+            ]
+        )
+
+        results = await _scan(svc)
+
+        assert log.scanned == ["busy"]
+        assert [pr.repository_full_name for pr, _ in results] == ["acme/busy"]
+
+    def test_missing_count_is_treated_as_having_prs(self):
+        assert GitHubService._repo_has_open_prs({"nameWithOwner": "acme/x"})
+        assert GitHubService._repo_has_open_prs({"pullRequests": {"totalCount": None}})
+        assert not GitHubService._repo_has_open_prs({"pullRequests": {"totalCount": 0}})
+
+
+class TestQuickReject:
+    @pytest.mark.asyncio
+    async def test_title_rejected_candidates_skip_full_comparison(self):
+        svc, _ = _make_service(
+            ["acme/repo"],
+            [_pr_node(7), _pr_node(8, title="Bump urllib3 from 1.26.0 to 1.26.1")],
+        )
+        compared: list[int] = []
+
+        class _CountingComparator(PRComparator):
+            def compare_many(self, source_pr, targets, only_automation=True):
+                compared.extend(target_pr.number for target_pr in targets)
+                return super().compare_many(source_pr, targets, only_automation)
+
+        results = await _scan(svc, _CountingComparator())
+
+        assert compared == [7]
+        assert [pr.number for pr, _ in results] == [7]
+
+
+class TestMaxMatches:
+    @pytest.mark.asyncio
+    async def test_scan_stops_once_cap_is_reached(self):
+        names = [f"acme/repo{i}" for i in range(20)]
+        svc, log = _make_service(names, max_repo_tasks=1)
+
+        results = await _scan(svc, max_matches=3)
+
+        assert [pr.repository_full_name for pr, _ in results] == names[:3]
+        assert len(log.scanned) < len(names)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_overshoot_is_truncated(self):
+        names = [f"acme/repo{i}" for i in range(8)]
+        svc, _ = _make_service(names, delay=0.01)
+
+        results = await _scan(svc, max_matches=2)
+
+        assert [pr.repository_full_name for pr, _ in results] == names[:2]
+
+    @pytest.mark.asyncio
+    async def test_found_count_matches_truncated_result(self):
+        names = [f"acme/repo{i}" for i in range(8)]
+        svc, log = _make_service(names, delay=0.01)
+        svc._progress = Mock()
+
+        results = await _scan(svc, max_matches=2)
+
+        # Several repositories were in flight when the cap was reached.
+        assert len(log.scanned) > 2
+        counted = sum(c.args[0] for c in svc._progress.found_similar_pr.call_args_list)
+        assert counted == len(results) == 2
+
+
+class TestCandidateFiltering:
+    @pytest.mark.asyncio
+    async def test_non_candidates_are_not_converted(self):
+        human = _pr_node(8)
+        human["author"] = {"__typename": "User", "login": "someone"}
+        # The source PR itself, a human PR and one real candidate.
+        svc, _ = _make_service(["acme/source"], [_pr_node(1), human, _pr_node(7)])
+
+        converted: list[int] = []
+        to_pull_request_info = svc.to_pull_request_info
+
+        def counting_convert(repo_full_name, pr_node):
+            converted.append(pr_node["number"])
+            return to_pull_request_info(repo_full_name, pr_node)
+
+        svc.to_pull_request_info = counting_convert  # type: ignore[method-assign]
+
+        results = await _scan(svc)
+
+        assert converted == [7]
+        assert [pr.number for pr, _ in results] == [7]
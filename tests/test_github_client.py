@@ -74,6 +74,80 @@ class TestGitHubClient:
         assert repo == "repository"
         assert pr_number == 789
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com/owner/pull/5",
+            "https://github.com/owner/repo/pull/abc",
+            "https://github.com/owner/repo/pull/",
+            "https://github.com/owner/repo/pulls/5",
+        ],
+    )
+    def test_parse_pr_url_rejects_malformed_paths(self, url):
+        client = GitHubClient(token="test_token")
+        with pytest.raises(ValueError, match="Invalid GitHub PR URL"):
+            client.parse_pr_url(url)
+
+    @pytest.mark.parametrize(
+        ("state", "mergeable", "mergeable_state", "expected"),
+        [
+            ("closed", None, None, "Closed (closed)"),
+            ("open", True, "draft", "Draft PR"),
+            ("open", True, "clean", "Ready to merge"),
+            ("open", True, "unstable", "Ready to merge"),
+            ("open", True, "behind", "Rebase required"),
+            ("open", False, "dirty", "Merge conflicts"),
+            ("open", False, "behind", "Rebase required"),
+            ("open", False, "blocked", "Blocked by checks"),
+            ("open", False, None, "Not mergeable (unknown)"),
+            ("open", None, "behind", "Rebase required"),
+            ("open", None, "unknown", "Status unclear (unknown)"),
+        ],
+    )
+    def test_get_pr_status_details(self, state, mergeable, mergeable_state, expected):
+        client = GitHubClient(token="test_token")
+        pr = PullRequestInfo(
+            number=1,
+            title="Bump requests",
+            body=None,
+            author="dependabot[bot]",
+            head_sha="abc123",
+            base_branch="main",
+            head_branch="dependabot/pip/requests",
+            state=state,
+            mergeable=mergeable,
+            mergeable_state=mergeable_state,
+            behind_by=None,
+            files_changed=[],
+            repository_full_name="owner/repo",
+            html_url="https://github.com/owner/repo/pull/1",
+        )
+        assert client.get_pr_status_details(pr) == expected
+
+    def test_blocked_but_mergeable_pr_analyses_block_reason(self):
+        client = GitHubClient(token="test_token")
+        pr = PullRequestInfo(
+            number=1,
+            title="Bump requests",
+            body=None,
+            author="dependabot[bot]",
+            head_sha="abc123",
+            base_branch="main",
+            head_branch="dependabot/pip/requests",
+            state="open",
+            mergeable=True,
+            mergeable_state="blocked",
+            behind_by=None,
+            files_changed=[],
+            repository_full_name="owner/repo",
+            html_url="https://github.com/owner/repo/pull/1",
+        )
+        with patch.object(
+            client, "_analyze_block_reason", return_value="Requires approval"
+        ) as analyze:
+            assert client.get_pr_status_details(pr) == "Requires approval"
+        analyze.assert_called_once_with(pr)
+
     @patch("dependamerge.github_async.GitHubAsync")
     def test_get_pull_request_info(self, mock_async_class):
         # Setup async mocks properly
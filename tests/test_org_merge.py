@@ -573,6 +573,29 @@ class TestFetchOwnerOpenPrs:
         # 0 to the unmergeable tally.
         assert sorted(completed) == [0, 1]
 
+    @pytest.mark.asyncio
+    async def test_skips_repositories_without_open_prs(self):
+        svc = GitHubService(token="test_token")
+        collected: list[str] = []
+
+        async def fake_iter(owner):
+            yield {"nameWithOwner": "acme/alpha", "pullRequests": {"totalCount": 0}}
+            yield {"nameWithOwner": "acme/beta", "pullRequests": {"totalCount": 2}}
+
+        async def fake_collect(owner, repo, *, only_automation):
+            collected.append(repo)
+            return [_make_pr(1, repo=f"{owner}/{repo}")]
+
+        svc._iter_owner_repositories = fake_iter  # type: ignore[assignment]
+        svc._collect_repo_open_prs = fake_collect  # type: ignore[assignment]
+
+        prs, errors = await svc.fetch_owner_open_prs("acme")
+        await svc.close()
+
+        assert collected == ["beta"]
+        assert [pr.repository_full_name for pr in prs] == ["acme/beta"]
+        assert errors == []
+
     @pytest.mark.asyncio
     async def test_rate_limit_propagates(self):
         from dependamerge.github_async import RateLimitError
@@ -158,6 +158,30 @@ class TestIterReposUserFallback:
         finally:
             await service.close()
 
+    @pytest.mark.asyncio
+    async def test_archived_repositories_filtered_server_side(self, mocker):
+        """Both listing roots ask GitHub to leave archived repos out.
+
+        Archived repositories are never scanned, so paging through them
+        only costs round-trips and inflates the progress total.
+        """
+        service = GitHubService(token="test_token")
+        try:
+            graphql = mocker.patch.object(
+                service._api,
+                "graphql",
+                side_effect=_make_user_account_graphql("auser", []),
+            )
+
+            _ = [r async for r in service._iter_owner_repositories("auser")]
+
+            queries = [call.args[0] for call in graphql.call_args_list]
+            assert any("organization(login:" in q for q in queries)
+            assert any("user(login:" in q for q in queries)
+            assert all("isArchived: false" in q for q in queries)
+        finally:
+            await service.close()
+
 
 class TestStatusUserAccount:
     """``gather_organization_status`` against a personal user account."""
@@ -1,8 +1,67 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: 2025 The Linux Foundation
 
+import re
+from difflib import SequenceMatcher
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dependamerge import pr_comparator
 from dependamerge.models import FileChange, PullRequestInfo
-from dependamerge.pr_comparator import PRComparator
+from dependamerge.pr_comparator import PRComparator, _sequence_ratio
+
+
+def _file_change(
+    filename: str,
+    *,
+    additions: int = 1,
+    deletions: int = 1,
+    changes: int = 2,
+    status: str = "modified",
+) -> FileChange:
+    """A FileChange with one-line-edit defaults; tests override what matters."""
+    return FileChange(
+        filename=filename,
+        additions=additions,
+        deletions=deletions,
+        changes=changes,
+        status=status,
+    )
+
+
+def _make_pr(**overrides: Any) -> PullRequestInfo:
+    """A Dependabot ``requests`` bump; tests override only what they vary.
+
+    Built through the validating constructor on purpose: pydantic-core
+    validation is cheaper here than ``model_construct`` (about 5us against
+    10us per PR), and the tests keep exercising the real coercion path.
+    """
+    defaults: dict[str, Any] = {
+        "number": 1,
+        "title": "Bump requests from 2.28.0 to 2.28.1",
+        "body": "Bumps requests from 2.28.0 to 2.28.1",
+        "author": "dependabot[bot]",
+        "head_sha": "abc123",
+        "base_branch": "main",
+        "head_branch": "dependabot/pip/requests-2.28.1",
+        "state": "open",
+        "mergeable": True,
+        "mergeable_state": "clean",
+        "behind_by": 0,
+        "files_changed": [],
+        "repository_full_name": "owner/repo",
+        "html_url": "https://github.com/owner/repo/pull/1",
+    }
+    defaults.update(overrides)
+    return PullRequestInfo(**defaults)
+
+
+@pytest.fixture(scope="module")
+def comparator():
+    """Default-threshold PRComparator, shared: it holds no per-test state."""
+    return PRComparator()
 
 
 class TestPRComparator:
@@ -14,203 +73,195 @@ class TestPRComparator:
         comparator = PRComparator(0.9)
         assert comparator.similarity_threshold == 0.9
 
-    def test_normalize_title_removes_versions(self):
-        comparator = PRComparator()
-
+    def test_normalize_title_removes_versions(self, comparator):
         original = "Bump dependency from 1.2.3 to 1.2.4"
         normalized = comparator._normalize_title(original)
         assert "1.2.3" not in normalized
         assert "1.2.4" not in normalized
         assert "bump dependency from to" in normalized
 
-    def test_normalize_title_removes_commit_hashes(self):
-        comparator = PRComparator()
-
+    def test_normalize_title_removes_commit_hashes(self, comparator):
         original = "Update to commit abc123def456"
         normalized = comparator._normalize_title(original)
         assert "abc123def456" not in normalized
         assert "update to commit" in normalized
 
-    def test_compare_titles_identical(self):
-        comparator = PRComparator()
+    def test_normalize_title_strips_hash_exposed_by_version(self, comparator):
+        assert comparator._normalize_title("Pin deadbeef1.2.3 tool") == "pin tool"
+
+    def test_normalization_patterns_precompiled(self):
+        """Normalization uses module-level compiled patterns, not re.sub(str)."""
+        for name in (
+            "_VERSION_RE",
+            "_HASH_RE",
+            "_DATE_RE",
+            "_FNAME_VER_RE",
+            "_URL_RE",
+            "_BODY_VERSION_RE",
+            "_PR_NUMBER_RE",
+            "_WHITESPACE_RE",
+            "_QUOTE_RE",
+            "_DEPENDENCY_NAME_RE",
+            "_BUMPS_PACKAGE_RE",
+            "_USES_ACTION_RE",
+        ):
+            assert isinstance(getattr(pr_comparator, name), re.Pattern), name
+        assert all(
+            isinstance(pattern, re.Pattern)
+            for pattern in pr_comparator._PACKAGE_UPDATE_PATTERNS
+        )
+
+    def test_normalization_is_memoised(self, comparator):
+        title = "Bump memoised-package from 1.0.0 to 1.0.1"
 
+        first = comparator._normalize_title(title)
+        hits = PRComparator._normalize_title.cache_info().hits
+        assert PRComparator()._normalize_title(title) == first
+        assert PRComparator._normalize_title.cache_info().hits == hits + 1
+
+    def test_compare_titles_identical(self, comparator):
         title1 = "Bump requests from 2.28.0 to 2.28.1"
         title2 = "Bump requests from 2.27.0 to 2.28.1"
 
         score = comparator._compare_titles(title1, title2)
         assert score > 0.8  # Should be very similar after normalization
 
-    def test_compare_file_changes_identical(self):
-        comparator = PRComparator()
-
-        files1 = [
-            FileChange(
-                filename="requirements.txt",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
-            ),
-            FileChange(
-                filename="setup.py",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
-            ),
+    def test_sequence_ratio_matches_difflib(self):
+        """The shortcut paths agree with SequenceMatcher.ratio()."""
+        pairs = [
+            ("pre-commit autoupdate", "pre-commit autoupdate"),
+            ("", ""),
+            ("", "bump requests"),
+            ("bump requests", "bump urllib3"),
         ]
-        files2 = [
-            FileChange(
-                filename="requirements.txt",
-                additions=2,
-                deletions=1,
-                changes=3,
-                status="modified",
+        for a, b in pairs:
+            assert _sequence_ratio(a, b) == SequenceMatcher(None, a, b).ratio()
+
+    def test_sequence_ratio_score_cutoff(self):
+        """Ratios below the cutoff report 0.0; others are exact."""
+        pairs = [
+            ("bump requests", "bump urllib3"),
+            ("fix login page", "refactor ci matrix"),
+            ("update workflow", "updates workflows"),
+        ]
+        for a, b in pairs:
+            ratio = SequenceMatcher(None, a, b).ratio()
+            for cutoff in (0.1, 0.5, 0.9):
+                expected = ratio if ratio >= cutoff else 0.0
+                assert _sequence_ratio(a, b, score_cutoff=cutoff) == expected
+
+    @pytest.mark.parametrize(
+        ("files1", "files2", "expected"),
+        [
+            # Same files changed, whatever the line counts
+            (
+                [_file_change("requirements.txt"), _file_change("setup.py")],
+                [
+                    _file_change("requirements.txt", additions=2, changes=3),
+                    _file_change("setup.py", deletions=2, changes=3),
+                ],
+                1.0,
             ),
-            FileChange(
-                filename="setup.py",
-                additions=1,
-                deletions=2,
-                changes=3,
-                status="modified",
+            # Partial overlap: 1 shared file out of 3 in the union
+            (
+                [_file_change("requirements.txt"), _file_change("setup.py")],
+                [_file_change("requirements.txt"), _file_change("package.json")],
+                1 / 3,
             ),
-        ]
+        ],
+        ids=["identical", "partial_overlap"],
+    )
+    def test_compare_file_changes(self, comparator, files1, files2, expected):
+        assert comparator._compare_file_changes(files1, files2) == expected
+
+    def test_compare_file_changes_exact_at_file_cap(self, comparator):
+        """The Jaccard index stays exact for PRs at the 300-file compare cap."""
+        files1 = [_file_change(f"src/module_{i}.py") for i in range(300)]
+        files2 = [_file_change(f"src/module_{i}.py") for i in range(150, 450)]
 
         score = comparator._compare_file_changes(files1, files2)
-        assert score == 1.0  # Same files changed
+        assert score == 150 / 450
 
-    def test_compare_file_changes_partial_overlap(self):
-        comparator = PRComparator()
+    def test_compare_file_changes_ignores_files_past_cap(self, comparator):
+        files1 = [_file_change(f"src/module_{i}.py") for i in range(300)]
+        files2 = files1 + [_file_change(f"src/extra_{i}.py") for i in range(100)]
 
-        files1 = [
-            FileChange(
-                filename="requirements.txt",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
-            ),
-            FileChange(
-                filename="setup.py",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
-            ),
-        ]
-        files2 = [
-            FileChange(
-                filename="requirements.txt",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
-            ),
-            FileChange(
-                filename="package.json",
-                additions=1,
-                deletions=1,
-                changes=2,
-                status="modified",
+        assert comparator._compare_file_changes(files1, files2) == 1.0
+
+    def test_filename_set_normalizes_paths(self):
+        files = [
+            _file_change(
+                "Docs/Release-1.2.3.md", deletions=0, changes=1, status="added"
             ),
+            _file_change("requirements.txt"),
         ]
 
-        score = comparator._compare_file_changes(files1, files2)
-        assert 0.3 < score < 0.7  # Partial overlap
+        assert PRComparator._filename_set(files) == {
+            "docs/release-.md",
+            "requirements.txt",
+        }
 
-    def test_is_automation_pr_dependabot(self):
-        comparator = PRComparator()
+    def test_file_score_follows_changed_files(self, comparator):
+        source = _make_pr(files_changed=[_file_change("requirements.txt")])
+        target = source.model_copy(update={"number": 2})
+        assert comparator.compare_pull_requests(source, target).is_similar
 
-        pr = PullRequestInfo(
-            number=1,
-            title="Bump requests from 2.28.0 to 2.28.1",
-            body="Bumps requests from 2.28.0 to 2.28.1",
-            author="dependabot[bot]",
-            head_sha="abc123",
-            base_branch="main",
-            head_branch="dependabot/pip/requests-2.28.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[],
-            repository_full_name="owner/repo",
-            html_url="https://github.com/owner/repo/pull/1",
-        )
-
-        assert comparator._is_automation_pr(pr)
-
-    def test_is_automation_pr_human(self):
-        comparator = PRComparator()
+        moved = target.model_copy(
+            update={"files_changed": [_file_change("package.json")]}
+        )
+        assert not comparator.compare_pull_requests(source, moved).is_similar
+        assert not comparator.compare_pull_requests(moved, source).is_similar
+
+        target.files_changed = [_file_change("package.json")]
+        assert not comparator.compare_pull_requests(source, target).is_similar
+
+    @pytest.mark.parametrize(
+        ("title", "body", "author", "head_branch", "expected"),
+        [
+            (
+                "Bump requests from 2.28.0 to 2.28.1",
+                "Bumps requests from 2.28.0 to 2.28.1",
+                "dependabot[bot]",
+                "dependabot/pip/requests-2.28.1",
+                True,
+            ),
+            (
+                "Fix bug in user authentication",
+                "This PR fixes a critical bug",
+                "human-developer",
+                "fix-auth-bug",
+                False,
+            ),
+        ],
+        ids=["dependabot", "human"],
+    )
+    def test_is_automation_pr(
+        self, comparator, title, body, author, head_branch, expected
+    ):
+        pr = _make_pr(
+            title=title,
+            body=body,
+            author=author,
+            head_branch=head_branch,
+        )
 
-        pr = PullRequestInfo(
-            number=1,
-            title="Fix bug in user authentication",
-            body="This PR fixes a critical bug",
-            author="human-developer",
-            head_sha="abc123",
-            base_branch="main",
-            head_branch="fix-auth-bug",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[],
-            repository_full_name="owner/repo",
-            html_url="https://github.com/owner/repo/pull/1",
-        )
-
-        assert not comparator._is_automation_pr(pr)
+        assert comparator._is_automation_pr(pr) is expected
 
     def test_compare_similar_automation_prs(self):
         comparator = PRComparator(0.7)
 
-        pr1 = PullRequestInfo(
-            number=1,
-            title="Bump requests from 2.28.0 to 2.28.1",
-            body="Bumps requests from 2.28.0 to 2.28.1",
-            author="dependabot[bot]",
-            head_sha="abc123",
-            base_branch="main",
-            head_branch="dependabot/pip/requests-2.28.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename="requirements.txt",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+        pr1 = _make_pr(
+            files_changed=[_file_change("requirements.txt")],
             repository_full_name="owner/repo1",
             html_url="https://github.com/owner/repo1/pull/1",
         )
 
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=2,
             title="Bump requests from 2.27.0 to 2.28.1",
             body="Bumps requests from 2.27.0 to 2.28.1",
-            author="dependabot[bot]",
             head_sha="def456",
-            base_branch="main",
-            head_branch="dependabot/pip/requests-2.28.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename="requirements.txt",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change("requirements.txt")],
             repository_full_name="owner/repo2",
             html_url="https://github.com/owner/repo2/pull/2",
         )
@@ -225,52 +276,25 @@ class TestPRComparator:
         comparator = PRComparator(0.8)
 
         # PR updating docker/metadata-action
-        pr1 = PullRequestInfo(
+        pr1 = _make_pr(
             number=34,
             title="Chore: Bump docker/metadata-action from 5.7.0 to 5.8.0",
             body="Bumps docker/metadata-action from 5.7.0 to 5.8.0",
-            author="dependabot[bot]",
-            head_sha="abc123",
-            base_branch="main",
             head_branch="dependabot/github_actions/docker/metadata-action-5.8.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename=".github/workflows/ci.yml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change(".github/workflows/ci.yml")],
             repository_full_name="repo1",
             html_url="https://github.com/repo1/pull/34",
         )
 
         # PR updating lfreleng-actions/python-build-action (different package)
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=72,
             title="Chore: Bump lfreleng-actions/python-build-action from 1.2.0 to 1.3.0",
             body="Bumps lfreleng-actions/python-build-action from 1.2.0 to 1.3.0",
-            author="dependabot[bot]",
             head_sha="def456",
-            base_branch="main",
             head_branch="dependabot/github_actions/lfreleng-actions/python-build-action-1.3.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/ci.yml",  # Same filename
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
+                _file_change(".github/workflows/ci.yml"),  # Same filename
             ],
             repository_full_name="repo2",
             html_url="https://github.com/repo2/pull/72",
@@ -285,57 +309,75 @@ class TestPRComparator:
         title_score = comparator._compare_titles(pr1.title, pr2.title)
         assert title_score == 0.0
 
+    def test_compare_stops_once_threshold_is_out_of_reach(self):
+        """A different author rules the pair out before bodies are scored."""
+        comparator = PRComparator(0.8)
+        files = [_file_change("requirements.txt")]
+        pr1 = _make_pr(
+            files_changed=files,
+            repository_full_name="repo1",
+            html_url="https://github.com/repo1/pull/1",
+        )
+        pr2 = pr1.model_copy(
+            update={"author": "renovate[bot]", "repository_full_name": "repo2"}
+        )
+
+        with patch.object(comparator, "_compare_bodies") as compare_bodies:
+            result = comparator.compare_pull_requests(pr1, pr2)
+
+        compare_bodies.assert_not_called()
+        assert not result.is_similar
+        assert result.confidence_score < 0.8
+
+        # The same pair from one author is fully scored and matches.
+        result = comparator.compare_pull_requests(pr1, pr1)
+        assert result.is_similar
+        assert result.confidence_score == 1.0
+        assert result.reasons == [
+            "Similar titles (score: 1.00)",
+            "Similar PR descriptions (score: 1.00)",
+            "Similar file changes (score: 1.00)",
+            "Same automation author",
+        ]
+
+    def test_rejected_pair_reports_confidence_of_scored_metrics(self):
+        comparator = PRComparator(0.8)
+        pr1 = _make_pr(files_changed=[_file_change("requirements.txt")])
+        pr2 = pr1.model_copy(update={"files_changed": [_file_change("package.json")]})
+
+        with patch.object(comparator, "_compare_titles") as compare_titles:
+            result = comparator.compare_pull_requests(pr1, pr2)
+
+        # Rejected after author (1.0) and files (0.0); titles and bodies
+        # are neither scored nor counted.
+        compare_titles.assert_not_called()
+        assert not result.is_similar
+        assert result.confidence_score == 0.5
+        assert result.reasons == ["Same automation author"]
+
     def test_same_package_different_versions_similar(self):
         """Test that PRs updating the same package to different versions are similar."""
         comparator = PRComparator(0.8)
 
         # PR updating docker/metadata-action to 5.8.0
-        pr1 = PullRequestInfo(
-            number=1,
+        pr1 = _make_pr(
             title="Chore: Bump docker/metadata-action from 5.7.0 to 5.8.0",
             body="Bumps docker/metadata-action from 5.7.0 to 5.8.0",
-            author="dependabot[bot]",
-            head_sha="abc123",
-            base_branch="main",
             head_branch="dependabot/github_actions/docker/metadata-action-5.8.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename=".github/workflows/ci.yml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change(".github/workflows/ci.yml")],
             repository_full_name="repo1",
             html_url="https://github.com/repo1/pull/1",
         )
 
         # PR updating same package (docker/metadata-action) to same version
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=2,
             title="Chore: Bump docker/metadata-action from 5.6.0 to 5.8.0",
             body="Bumps docker/metadata-action from 5.6.0 to 5.8.0",
-            author="dependabot[bot]",
             head_sha="def456",
-            base_branch="main",
             head_branch="dependabot/github_actions/docker/metadata-action-5.8.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/ci.yml",  # Same filename
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
+                _file_change(".github/workflows/ci.yml"),  # Same filename
             ],
             repository_full_name="repo2",
             html_url="https://github.com/repo2/pull/2",
@@ -350,10 +392,8 @@ class TestPRComparator:
         title_score = comparator._compare_titles(pr1.title, pr2.title)
         assert title_score == 1.0
 
-    def test_extract_package_name(self):
+    def test_extract_package_name(self, comparator):
         """Test package name extraction from various title formats."""
-        comparator = PRComparator()
-
         # Test various patterns
         test_cases = [
             (
@@ -375,30 +415,151 @@ class TestPRComparator:
             actual_package = comparator._extract_package_name(title)
             assert actual_package == expected_package, f"Failed for title: {title}"
 
+    def test_extract_package_name_is_memoised(self):
+        title = "Bump memoised-extract from 1.0.0 to 1.0.1"
+        assert PRComparator()._extract_package_name(title) == "memoised-extract"
+        hits = PRComparator._extract_package_name.cache_info().hits
+        assert PRComparator()._extract_package_name(title) == "memoised-extract"
+        assert PRComparator._extract_package_name.cache_info().hits == hits + 1
+
+    def test_bump_titles_compared_without_fuzzy_matching(self, comparator):
+        """Version-bump titles are decided by package name alone."""
+        titles = [f"Bump package-{i} from 1.0.{i} to 1.1.{i}" for i in range(50)]
+        rebumped = [f"Bump package-{i} from 0.9.0 to 1.1.{i}" for i in range(50)]
+
+        with patch("dependamerge.pr_comparator._sequence_ratio") as ratio:
+            scores = [
+                [comparator._compare_titles(a, b) for b in rebumped] for a in titles
+            ]
+
+        ratio.assert_not_called()
+        for i, row in enumerate(scores):
+            assert row == [1.0 if j == i else 0.0 for j in range(len(rebumped))]
+
+    def test_quick_reject_by_title(self, comparator):
+        """Titles alone rule out different packages but never a real match."""
+        assert comparator.quick_reject(
+            "Bump requests from 2.28.0 to 2.28.1",
+            "Bump urllib3 from 1.26.0 to 1.26.1",
+        )
+        assert not comparator.quick_reject(
+            "Bump requests from 2.28.0 to 2.28.1",
+            "Bump requests from 2.27.0 to 2.28.1",
+        )
+        # Unrelated free-form titles with a low ratio are rejected, but
+        # not when a lower threshold leaves room for the other scores.
+        assert comparator.quick_reject("Fix login page", "Refactor CI matrix")
+        assert not PRComparator(0.2).quick_reject(
+            "Fix login page", "Refactor CI matrix"
+        )
+
+    def test_compare_many_matches_pairwise(self, comparator):
+        files = [_file_change("requirements.txt")]
+        source = _make_pr(
+            files_changed=files,
+            repository_full_name="owner/repo1",
+            html_url="https://github.com/owner/repo1/pull/1",
+        )
+        targets = [
+            source.model_copy(update={"repository_full_name": "owner/repo2"}),
+            source.model_copy(
+                update={"title": "Bump urllib3 from 1.26.0 to 1.26.1", "number": 2}
+            ),
+            source.model_copy(update={"author": "renovate[bot]", "number": 3}),
+        ]
+
+        results = comparator.compare_many(source, targets)
+
+        assert results == [
+            comparator.compare_pull_requests(source, target) for target in targets
+        ]
+        assert [r.is_similar for r in results] == [True, False, False]
+
+        human = _make_pr(
+            title="Fix login page",
+            body="Fixes the login page",
+            author="someone",
+            files_changed=files,
+        )
+        human_results = comparator.compare_many(human, targets)
+        assert human_results == [
+            comparator.compare_pull_requests(human, target) for target in targets
+        ]
+        for result in human_results:
+            assert not result.is_similar
+            assert result.reasons == ["One or both PRs are not from automation tools"]
+        assert comparator.compare_many(source, []) == []
+
+    def test_automation_check_follows_copied_fields(self, comparator):
+        files = [_file_change("requirements.txt")]
+        source = _make_pr(files_changed=files)
+        target = source.model_copy(update={"number": 2})
+        assert comparator.compare_many(source, [target])[0].is_similar
+
+        human = source.model_copy(
+            update={
+                "title": "Fix login page",
+                "body": "Fixes the login page",
+                "author": "someone",
+            }
+        )
+        result = comparator.compare_many(human, [target])[0]
+
+        assert not result.is_similar
+        assert result.confidence_score == 0.0
+        assert result.reasons == ["One or both PRs are not from automation tools"]
+
+    @pytest.mark.parametrize("n", [10, 100])
+    def test_compare_many_at_scale(self, comparator, n):
+        """One source against n candidates: one pass each, bodies only if needed.
+
+        Even-numbered candidates bump the source's package, odd ones a
+        different package; only the former can match, so only they get
+        as far as body scoring.
+        """
+        files = [_file_change("requirements.txt")]
+        source = _make_pr(
+            title="Bump pkg-0 from 1.0.0 to 1.0.1",
+            body="Bumps pkg-0 from 1.0.0 to 1.0.1",
+            files_changed=files,
+        )
+        targets = [
+            _make_pr(
+                number=i + 2,
+                title=f"Bump pkg-{0 if i % 2 == 0 else i} from 0.9.{i} to 1.0.1",
+                body=f"Bumps pkg-{0 if i % 2 == 0 else i} from 0.9.{i} to 1.0.1",
+                files_changed=files,
+                repository_full_name=f"owner/repo{i}",
+            )
+            for i in range(n)
+        ]
+
+        with patch.object(
+            comparator, "_compare_bodies", wraps=comparator._compare_bodies
+        ) as compare_bodies:
+            results = comparator.compare_many(source, targets)
+
+        assert len(results) == n
+        assert [r.is_similar for r in results] == [i % 2 == 0 for i in range(n)]
+        assert compare_bodies.call_count == (n + 1) // 2
+
     def test_compare_non_automation_prs(self):
         """Test that non-automation PRs can be compared when only_automation=False."""
         comparator = PRComparator(0.7)
 
         # Non-automation PR 1 with similar workflow update
-        pr1 = PullRequestInfo(
+        pr1 = _make_pr(
             number=9,
             title="CI: Update tag-push.yaml workflow",
             body="Updates the tag-push workflow configuration",
             author="ModeSevenIndustrialSolutions",
-            head_sha="abc123",
-            base_branch="main",
             head_branch="fix-workflow",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/tag-push.yaml",
+                _file_change(
+                    ".github/workflows/tag-push.yaml",
                     additions=5,
                     deletions=2,
                     changes=7,
-                    status="modified",
                 )
             ],
             repository_full_name="org/repo1",
@@ -406,26 +567,15 @@ class TestPRComparator:
         )
 
         # Non-automation PR 2 with similar workflow update from same author
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=15,
             title="CI: Update tag-push.yaml workflow configuration",
             body="Updates the tag-push workflow for better performance",
             author="ModeSevenIndustrialSolutions",
             head_sha="def456",
-            base_branch="main",
             head_branch="update-workflow",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/tag-push.yaml",
-                    additions=3,
-                    deletions=1,
-                    changes=4,
-                    status="modified",
-                )
+                _file_change(".github/workflows/tag-push.yaml", additions=3, changes=4)
             ],
             repository_full_name="org/repo2",
             html_url="https://github.com/org/repo2/pull/15",
@@ -453,53 +603,26 @@ class TestPRComparator:
         comparator = PRComparator(0.8)
 
         # Create PR with semantic-pull-request.yaml workflow
-        pr1 = PullRequestInfo(
+        pr1 = _make_pr(
             number=15,
             title="Chore: Bump amannn/action-semantic-pull-request from 6.0.1 to 6.1.1",
             body="Bumps [amannn/action-semantic-pull-request](https://github.com/amannn/action-semantic-pull-request) from 6.0.1 to 6.1.1.",
-            author="dependabot[bot]",
-            head_sha="abc123",
-            base_branch="main",
             head_branch="dependabot/github_actions/amannn/action-semantic-pull-request-6.1.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/semantic-pull-request.yaml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
+                _file_change(".github/workflows/semantic-pull-request.yaml")
             ],
             repository_full_name="org/repo1",
             html_url="https://github.com/org/repo1/pull/15",
         )
 
         # Create PR with ci.yml workflow (different filename)
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=23,
             title="Chore: Bump amannn/action-semantic-pull-request from 6.0.1 to 6.1.1",
             body="Bumps [amannn/action-semantic-pull-request](https://github.com/amannn/action-semantic-pull-request) from 6.0.1 to 6.1.1.",
-            author="dependabot[bot]",
             head_sha="def456",
-            base_branch="main",
             head_branch="dependabot/github_actions/amannn/action-semantic-pull-request-6.1.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename=".github/workflows/ci.yml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change(".github/workflows/ci.yml")],
             repository_full_name="org/repo2",
             html_url="https://github.com/org/repo2/pull/23",
         )
@@ -519,52 +642,24 @@ class TestPRComparator:
         assert any("Similar titles" in reason for reason in result.reasons)
 
         # Test with non-workflow files - should still get 0.0
-        pr3 = PullRequestInfo(
+        pr3 = _make_pr(
             number=24,
             title="Chore: Bump some-package from 1.0.0 to 1.1.0",
             body="Bumps some-package from 1.0.0 to 1.1.0.",
-            author="dependabot[bot]",
             head_sha="ghi789",
-            base_branch="main",
             head_branch="dependabot/npm_and_yarn/some-package-1.1.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename="package.json",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change("package.json")],
             repository_full_name="org/repo3",
             html_url="https://github.com/org/repo3/pull/24",
         )
 
-        pr4 = PullRequestInfo(
+        pr4 = _make_pr(
             number=25,
             title="Chore: Bump some-package from 1.0.0 to 1.1.0",
             body="Bumps some-package from 1.0.0 to 1.1.0.",
-            author="dependabot[bot]",
             head_sha="jkl012",
-            base_branch="main",
             head_branch="dependabot/npm_and_yarn/some-package-1.1.0",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
-            files_changed=[
-                FileChange(
-                    filename="requirements.txt",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
-            ],
+            files_changed=[_file_change("requirements.txt")],
             repository_full_name="org/repo4",
             html_url="https://github.com/org/repo4/pull/25",
         )
@@ -582,52 +677,29 @@ class TestPRComparator:
         comparator = PRComparator(0.8)
 
         # Create PR with REST API style author (dependabot[bot])
-        pr1 = PullRequestInfo(
+        pr1 = _make_pr(
             number=15,
             title="Chore: Bump amannn/action-semantic-pull-request from 6.0.1 to 6.1.1",
             body="Bumps [amannn/action-semantic-pull-request] from 6.0.1 to 6.1.1.",
             author="dependabot[bot]",  # REST API format
-            head_sha="abc123",
-            base_branch="main",
             head_branch="dependabot/github_actions/amannn/action-semantic-pull-request-6.1.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/semantic-pull-request.yaml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
+                _file_change(".github/workflows/semantic-pull-request.yaml")
             ],
             repository_full_name="org/repo1",
             html_url="https://github.com/org/repo1/pull/15",
         )
 
         # Create PR with GraphQL API style author (dependabot)
-        pr2 = PullRequestInfo(
+        pr2 = _make_pr(
             number=18,
             title="Chore: Bump amannn/action-semantic-pull-request from 6.0.1 to 6.1.1",
             body="Bumps [amannn/action-semantic-pull-request] from 6.0.1 to 6.1.1.",
             author="dependabot",  # GraphQL API format (no [bot] suffix)
             head_sha="def456",
-            base_branch="main",
             head_branch="dependabot/github_actions/amannn/action-semantic-pull-request-6.1.1",
-            state="open",
-            mergeable=True,
-            mergeable_state="clean",
-            behind_by=0,
             files_changed=[
-                FileChange(
-                    filename=".github/workflows/semantic-pull-request.yaml",
-                    additions=1,
-                    deletions=1,
-                    changes=2,
-                    status="modified",
-                )
+                _file_change(".github/workflows/semantic-pull-request.yaml")
             ],
             repository_full_name="org/repo2",
             html_url="https://github.com/org/repo2/pull/18",
@@ -23,6 +23,7 @@ from dependamerge.cli import _MergeContext, _source_pr_modifies_workflows
 from dependamerge.github_async import GitHubAsync
 from dependamerge.github_async import PermissionError as GitHubPermissionError
 from dependamerge.models import FileChange, PullRequestInfo
+from dependamerge.pr_comparator import MAX_FILES_FOR_COMPARE
 
 # Test-only dummy token. Centralised in a constant to make clear it is a
 # fixture value, not a real credential, and to keep that intent obvious if
@@ -218,6 +219,13 @@ class TestSourcePrModifiesWorkflows:
         )
         assert _source_pr_modifies_workflows(cast(_MergeContext, ctx)) is True
 
+    def test_detects_workflow_past_compare_cap(self):
+        filenames = [f"src/module_{i}.py" for i in range(MAX_FILES_FOR_COMPARE)]
+        ctx = SimpleNamespace(
+            source_pr=_pr_with_files(*filenames, ".github/workflows/ci.yml")
+        )
+        assert _source_pr_modifies_workflows(cast(_MergeContext, ctx)) is True
+
     def test_ignores_non_workflow_changes(self):
         ctx = SimpleNamespace(
             source_pr=_pr_with_files("src/app.py", ".github/dependabot.yml")